@@ -1,9 +1,4 @@
+from Ex112.utilidadescev import unidades
 mt = float(input('Coloque uma distância em metros: '))
-km = mt / 1000
-hm = mt / 100
-dam = mt / 10
-m = mt
-da = mt * 10
-cm = mt * 100
-mm = mt * 1000
-print('{}km\n{}hm\n{}dam\n{}m\n{}da\n{}cm\n{}mm'.format(km, hm, dam, mt, da, cm, mm))
+for u in ('km', 'hm', 'dam', 'm', 'dm', 'cm', 'mm'):
+    print('{}{}'.format(unidades.converter(mt, 'm', u), u))
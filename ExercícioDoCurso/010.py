@@ -1,14 +1,12 @@
+from Ex112.utilidadescev.cambio import Cambio
+cambio = Cambio()
+nomes = {'dólar': ('USD', 'Dólar'), 'euro': ('EUR', 'Euro'), 'libra': ('GBP', 'Libra')}
 moeda = float(input('Quantos reais você tem? R$'))
 vari = input('Qual moeda deseja? (dólar, euro ou libra)')
-if (vari == 'dólar'):
-    print()
-    print('Você pode comprar US${:.2f} (Dólar)'.format(moeda / 5.49))
-elif (vari == 'euro'):
-    print()
-    print('Você pode comprar €{:.2f} (Euro)'.format(moeda / 6.56))
-elif (vari == 'libra'):
-    print()
-    print('Você pode comprar £{:.2f} (Libra)'.format(moeda / 7.62))
+print()
+if vari in nomes:
+    codigo, nome = nomes[vari]
+    valor = cambio.converter(moeda, 'BRL', codigo)
+    print('Você pode comprar {} ({})'.format(cambio.formatar(valor, codigo), nome))
 else:
-    print()
-    print('Não encontramos essa moeda!!!')
\ No newline at end of file
+    print('Não encontramos essa moeda!!!')
@@ -1,13 +1,6 @@
+from Ex112.utilidadescev import precos
+
 valor = float(input('Coloque o preço do produto: R$'))
-cinco = valor / 100 * 95
-dez = valor / 100 * 90
-quinze = valor / 100 * 85
-vinte = valor / 100 * 80
-vintecinco = valor / 100 * 75
-trinta  = valor / 100 * 70
-print('5% de desconto {:.2f}'.format(cinco))
-print('10% de desconto {:.2f}'.format(dez))
-print('15% de desconto {:.2f}'.format(quinze))
-print('20% de desconto {:.2f}'.format(vinte))
-print('25% de desconto {:.2f}'.format(vintecinco))
-print('30% de desconto {:.2f}'.format(trinta))
+descontos = (5, 10, 15, 20, 25, 30)
+for d, preco in zip(descontos, precos.grade([valor], [-d for d in descontos])[0]):
+    print('{}% de desconto {:.2f}'.format(d, preco))
@@ -1,17 +1,9 @@
+from Ex112.utilidadescev import precos
+
 salario = float(input('Qual é o seu salario? R$'))
-a = salario / 100 * 70
-b = salario / 100 * 80
-c = salario / 100 * 90
-d = salario / 100 * 110
-e = salario / 100 * 120
-f = salario / 100 * 130
+ajustes = (-30, -20, -10, -5, 10, 20, 30)
 print()
 print('_' * 20)
-print('{} - 30% = {:.2f}'.format(salario, a))
-print('{} - 20% = {:.2f}'.format(salario, b))
-print('{} - 10% = {:.2f}'.format(salario, c))
-print('{} - 5% = {:.2f}'.format(salario, salario / 100 * 95))
-print('{} + 10% = {:.2f}'.format(salario, d))
-print('{} + 20% = {:.2f}'.format(salario, e))
-print('{} + 30% = {:.2f}'.format(salario, f))
+for p, valor in zip(ajustes, precos.grade([salario], ajustes)[0]):
+    print('{} {} {}% = {:.2f}'.format(salario, '-' if p < 0 else '+', abs(p), valor))
 print('_' * 20)
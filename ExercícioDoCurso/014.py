@@ -1,3 +1,4 @@
+from Ex112.utilidadescev import unidades
 graus = float(input('\033[1;33mQuatos graus esta medindo? ºC: '))
-fire = graus * 1.8 + 32
+fire = unidades.converter(graus, '°C', '°F')
 print('\033[1;32m{}ºC\033[m equivale a \033[1;31m{} fahrenheit'.format(graus, fire))
@@ -1,65 +1,5 @@
-num = (input("Coloque um número: "))
-fra = len(num)
-if fra == 1:
-    print("Seu número tem {} unidade(s)".format(num[0]))
-    print("Seu número tem 0 dezena(s)")
-    print("Seu número tem 0 centena(s)")
-    print("Seu número tem 0 milhares(s)")
-    print("Seu número tem 0 dezena de milhare(s)")
-    print("Seu número tem 0 centena de milhare(s)")
-    print("Seu número tem 0 milhõe(s)")
-
-elif fra == 2:
-    print("Seu número tem {} unidade(s)".format(num[1]))
-    print("Seu número tem {} dezena(s)".format(num[0]))
-    print("Seu número tem 0 centena(s)")
-    print("Seu número tem 0 milhares(s)")
-    print("Seu número tem 0 dezena de milhare(s)")
-    print("Seu número tem 0 centena de milhare(s)")
-    print("Seu número tem 0 milhõe(s)")
-
-elif fra == 3:
-    print("Seu número tem {} unidade(s)".format(num[2]))
-    print("Seu número tem {} dezena(s)".format(num[1]))
-    print("Seu número tem {} centena(s)".format(num[0]))
-    print("Seu número tem 0 milhares(s)")
-    print("Seu número tem 0 dezena de milhare(s)")
-    print("Seu número tem 0 centena de milhare(s)")
-    print("Seu número tem 0 milhõe(s)")
-
-elif fra == 4:
-    print("Seu número tem {} unidade(s)".format(num[3]))
-    print("Seu número tem {} dezena(s)".format(num[2]))
-    print("Seu número tem {} centena(s)".format(num[1]))
-    print("Seu número tem {} milhares(s)".format(num[0]))
-    print("Seu número tem 0 dezena de milhare(s)")
-    print("Seu número tem 0 centena de milhare(s)")
-    print("Seu número tem 0 milhõe(s)")
-
-elif fra == 5:
-    print("Seu número tem {} unidade(s)".format(num[4]))
-    print("Seu número tem {} dezena(s)".format(num[3]))
-    print("Seu número tem {} centena(s)".format(num[2]))
-    print("Seu número tem {} milhares(s)".format(num[1]))
-    print("Seu número tem {} dezena de milhare(s)".format(num[0]))
-    print("Seu número tem 0 centena de milhare(s)")
-    print("Seu número tem 0 milhõe(s)")
-
-elif fra == 6:
-    print("Seu número tem {} unidade(s)".format(num[5]))
-    print("Seu número tem {} dezena(s)".format(num[4]))
-    print("Seu número tem {} centena(s)".format(num[3]))
-    print("Seu número tem {} milhares(s)".format(num[2]))
-    print("Seu número tem {} dezena de milhare(s)".format(num[1]))
-    print("Seu número tem {} centena de milhare(s)".format(num[0]))
-    print("Seu número tem 0 milhõe(s)")
-
-elif fra == 7:
-    print("Seu número tem {} unidade(s)".format(num[6]))
-    print("Seu número tem {} dezena(s)".format(num[5]))
-    print("Seu número tem {} centena(s)".format(num[4]))
-    print("Seu número tem {} milhares(s)".format(num[3]))
-    print("Seu número tem {} dezena de milhare(s)".format(num[2]))
-    print("Seu número tem {} centena de milhare(s)".format(num[1]))
-    print("Seu número tem {} milhõe(s)".format(num[0]))
-
+from Ex112.utilidadescev import numero
+nomes = ("unidade", "dezena", "centena", "milhares", "dezena de milhare", "centena de milhare", "milhõe")
+num = int(input("Coloque um número: "))
+for pos, (nome, dig) in enumerate(numero.casas(num, 7)):
+    print("Seu número tem {} {}(s)".format(dig, nomes[pos] if pos < len(nomes) else nome.lower()))
@@ -1,17 +1,8 @@
+from Ex112.utilidadescev import numero
 num = int(input("Coloque um número: "))
-u = num // 1 % 10
-d = num // 10 % 10
-c = num // 100 % 10
-m = num // 1000 % 10
-dm = num // 10000 % 10
-cm = num // 100000 % 10
-mm = num // 1000000 % 10
-print("======================")
-print("= Unidade           ", u,  "=")
-print("= Dezena            ", d,  "=")
-print("= Centena           ", c,  "=")
-print("= Milhar            ", m,  "=")
-print("= Dezena de Milhar  ", dm, "=")
-print("= Centena de Milhar ", cm, "=")
-print("= Milhão            ", mm, "=")
-print("======================")
\ No newline at end of file
+casas = numero.casas(num, 7)
+tam = max(len(nome) for nome, dig in casas) + 1
+print("=" * (tam + 4))
+for nome, dig in casas:
+    print(f"= {nome:<{tam}} {dig} =")
+print("=" * (tam + 4))
@@ -1,5 +1,6 @@
+from Ex112.utilidadescev import calendario
 ano = int(input("Que ano quer analisar? "))
-if ano % 4 == 0:
+if calendario.bissexto(ano):
     print("(*)=" * 6)
     print("O Ano de {} é BISSEXTO".format(ano))
     print("(*)=" * 6)
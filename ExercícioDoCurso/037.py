@@ -1,5 +1,6 @@
 import sys
 import time
+from Ex112.utilidadescev import numero
 print("\033[1;33m-=-" * 3)
 num = int(input("Coloque um número: "))
 print("\033[1;33m-=-" * 3)
@@ -31,19 +32,14 @@ def animation():
 animation()
 print("\033[1;33m-=-" * 3)
 
-bi = bin(num)
-octa = oct(num)
-hexa = hex(num)
-
-
 if op == 1:
-    print("O número {} em Binário é {}".format(num, bi[2:]))
+    print("O número {} em Binário é {}".format(num, numero.converter(num, 2)))
 
 elif op == 2:
-    print("O número {} em Octal é {}".format(num, octa[2:]))
+    print("O número {} em Octal é {}".format(num, numero.converter(num, 8)))
 
 elif op == 3:
-    print("O número {} em Hexadecimal é {}".format(num, hexa[2:]))
+    print("O número {} em Hexadecimal é {}".format(num, numero.converter(num, 16)))
 
 else:
     print("\033[1;31mColoque um número de 1 a 3!")
\ No newline at end of file
@@ -1,7 +1,7 @@
-import datetime
+from Ex112.utilidadescev import calendario
 ano = int(input("Em que ano você nasceu: "))
-ano2 = datetime.date.today().year
-idade = (ano2 - ano)
+ano2 = calendario.ano_atual()
+idade = calendario.idade(ano, ano2)
 alistamento = 18 - idade
 anoalistamento = alistamento + ano2
 anoalistamento2 = idade - 18
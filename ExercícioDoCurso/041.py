@@ -1,15 +1,7 @@
-from datetime import date
+from Ex112.utilidadescev import calendario
+from Ex112.utilidadescev import faixa
 ano = int(input("Coloque O ano que você nasceu: "))
-idade = (date.today().year - ano)
+idade = calendario.idade(ano)
 print()
 print("Você tem {} anos".format(idade))
-if idade <= 9:
-    print("Atleta Mirim.")
-elif idade > 9 and idade <= 14:
-    print("Atleta Infantil.")
-elif idade > 14 and idade <= 19:
-    print("Atleta Júnior.")
-elif idade > 19 and idade <= 25:
-    print("Atleta Sênior.")
-else:
-    print("Atleta Master.")
+print("Atleta {}.".format(faixa.ATLETA.classificar(idade)))
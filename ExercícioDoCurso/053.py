@@ -1,7 +1,7 @@
+from Ex112.utilidadescev.palindromo import palindromo
 a = str(input("Coloque um Frase: "))
 print()
-b = a.replace(" ", "").upper()
-if b == b[::-1]:
+if palindromo(a):
     print("A frase {} é um Palíndromo {}".format(a, a[::-1]))
 else:
     print("A frase {} Não é um Palíndromo {}".format(a, a[::-1]))
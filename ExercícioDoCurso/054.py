@@ -1,8 +1,7 @@
-import datetime
-ano2 = datetime.date.today().year
+from Ex112.utilidadescev import calendario
 k = 0
 for c in range(1, 8):
     ano = int(input("Em que ano você nasceu? "))
-    if 21 <= ano2 - ano:
+    if 21 <= calendario.idade(ano):
         k = k + 1
 print("Das 7 pessoas {}, Ja atingiram a maioridade ".format(k))
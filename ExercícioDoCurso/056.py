@@ -1,21 +1,19 @@
-ida = 0
-mida = 0
-med = 0
-hmv = "Não Tem"
+from Ex112.utilidadescev.pessoas import Pessoas
+grupo = Pessoas()
 for c in range(1, 5):
     print("+" * 5, "{}º Pessoa".format(c), "+" * 5)
     nome = input("Coloque Seu Nome: ")
     idade = int(input("Coloque Sua Idade: "))
-    HM = input("Homem Ou Mulher: [H/M] ").upper()
-    ida += idade
-    if HM == "H":
-        if idade > med:
-            hmv = nome
-            med = idade
-    if HM == "M" and idade < 20:
-            mida += 1
+    HM = input("Homem Ou Mulher: [H/M] ").strip().upper()
+    while HM not in ("H", "M"):
+        print("ERRO. Respostas apenas [H/M]")
+        HM = input("Homem Ou Mulher: [H/M] ").strip().upper()
+    grupo.adicionar(nome, idade, {"H": "M", "M": "F"}[HM])
+hmv = grupo.mais_velho("M")
 print()
-print("A idade média do grupo é {}".format(ida / 4))
-print("O Homem mais velho é o {} Com {} Anos".format(hmv, med))
-print("Tem {} Mulhere(s) Com Menos de 20 Anos".format(mida))
-
+print("A idade média do grupo é {}".format(grupo.media_idade()))
+if hmv is None:
+    print("O Homem mais velho é o Não Tem Com 0 Anos")
+else:
+    print("O Homem mais velho é o {} Com {} Anos".format(grupo.nome(hmv), grupo.idades[hmv]))
+print("Tem {} Mulhere(s) Com Menos de 20 Anos".format(grupo.contar(sexo="F", menor_que=20)))
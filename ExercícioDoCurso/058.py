@@ -1,21 +1,18 @@
-import random
-chute = 99
-pc = random.randint(0, 10)
-c = 0
-while pc != chute:
+from Ex112.utilidadescev import palpite
+pensador = palpite.Pensador(0, 10)
+resposta = None
+while resposta != palpite.ACERTOU:
     print("\033[1;33m-=-" * 10)
     print("\033[1;33mDe 0 a 10. Em qual número estou pensando?")
     chute = int(input("\033[1;35mTente Adivinhar: "))
-    c += 1
-    if pc > chute:
-        print("\033[1;33m-=-" * 10)
+    resposta = pensador.responder(chute)
+    print("\033[1;33m-=-" * 10)
+    if resposta == palpite.MAIS:
         print("\033[1;97mUm pouco Mais!")
-    elif pc == chute:
-        print("\033[1;33m-=-" * 10)
+    elif resposta == palpite.ACERTOU:
         print("\033[1;32mBoa!!!")
     else:
-        print("\033[1;33m-=-" * 10)
         print("\033[1;97mUm pouco Menos!")
 print("\033[1;33m-=-" * 10)
 print("\033[1;32mPARABÉNS!!! Você me venceu!")
-print("\033[1;97mVocê precisou de \033[1;31m{} \033[1;97mpalpites para ganhar!".format(c))
+print("\033[1;97mVocê precisou de \033[1;31m{} \033[1;97mpalpites para ganhar!".format(pensador.palpites))
@@ -1,7 +1,3 @@
-soma = conta = n = 0
-n = float(input("Coloque um número [999 Para parar]: "))
-while n != 999:
-    conta += 1
-    soma += n
-    n = float(input("Coloque um número [999 Para parar]: "))
-print("Foram {} números E a soma deles foi {}".format(conta, soma))
+from Ex112.utilidadescev import estatistica
+numeros = estatistica.Estatistica(estatistica.ate(lambda: float(input("Coloque um número [999 Para parar]: ")), 999))
+print("Foram {} números E a soma deles foi {}".format(numeros.total, numeros.soma))
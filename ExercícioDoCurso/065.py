@@ -1,15 +1,9 @@
+from Ex112.utilidadescev.estatistica import Estatistica
 cont = "S"
-tot = maior = contador = 0
-menor = 9999999999999999999999999999999999999999
+numeros = Estatistica()
 while cont in "S":
     n = float(input("Coloque um número: "))
     cont = str(input("Deseja Continuar: [S/N]")).upper().strip()[0]
-    tot += n
-    contador += 1
-    if n > maior:
-        maior = n
-    if n < menor:
-        menor = n
-media = tot / contador
-print("Foram digitados {} números, a média entre ele foi de {}.".format(contador, media))
-print("O maior Foi {} e o menor {}".format(maior, menor))
+    numeros.ler(n)
+print("Foram digitados {} números, a média entre ele foi de {}.".format(numeros.total, numeros.media))
+print("O maior Foi {} e o menor {}".format(numeros.maior, numeros.menor))
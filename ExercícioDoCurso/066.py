@@ -1,9 +1,4 @@
-cont = soma = 0
-while True:
-    n = int(input("Coloque um número: "))
-    if n == 999:
-        break
-    soma += n
-    cont += 1
+from Ex112.utilidadescev import estatistica
+numeros = estatistica.Estatistica(estatistica.ate(lambda: int(input("Coloque um número: ")), 999))
 print()
-print(f"A soma De {cont} valores Foi {soma}!")
+print(f"A soma De {numeros.total} valores Foi {numeros.soma}!")
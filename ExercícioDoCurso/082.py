@@ -1,8 +1,6 @@
-listap = []
-listai = []
+from Ex112.utilidadescev.particao import particionar
 lista = []
 cont = " "
-add = 0
 while True:
     n = int(input("Coloque um valor: "))
     lista.append(n)
@@ -11,16 +9,8 @@ while True:
     if cont == "N":
         break
     cont = " "
-tot = len(lista)
-while add != tot:
-    if lista[add] % 2 == 0:
-        listap.append(lista[add])
-    else:
-        listai.append(lista[add])
-    add += 1
 lista.sort()
-listap.sort()
-listai.sort()
+listap, listai = particionar(lista)
 print(f"A lista inteira {lista}")
 print(f"A lista de pares {listap}")
 print(f"A lista de impares {listai}")
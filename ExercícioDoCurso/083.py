@@ -1,16 +1,8 @@
-direita = []
-esquerda = []
-cont = 0
+from Ex112.utilidadescev import expressao
 esprecao = input("Coloque seua expreção numérica: ")
-a = len(esprecao)
-while cont != a:
-    if esprecao[cont] == "(":
-        esquerda.append(esprecao[cont])
-    elif esprecao[cont] == ")":
-        direita.append(esprecao[cont])
-    cont += 1
-    if len(direita) > len(esquerda):
-        print("Espreção inválida!")
-        break
-if len(direita) == len(esquerda):
-    print("Espreção válida")    
+valida, pos = expressao.validar(esprecao)
+if valida:
+    print("Espreção válida")
+else:
+    print("Espreção inválida!")
+    print(f"Erro no caractere {pos + 1}: {esprecao[:pos]}\033[1;31m{esprecao[pos]}\033[m{esprecao[pos + 1:]}")
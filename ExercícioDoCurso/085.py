@@ -1,11 +1,5 @@
-lista = [[], []]
-for c in range(0, 7):
-    n = int(input("Coloque um número: "))
-    if n % 2 == 0:
-        lista[0].append(n)
-    else:
-        lista[1].append(n)
-lista[0].sort()
-lista[1].sort()
+from Ex112.utilidadescev.particao import particionar
+numeros = [int(input("Coloque um número: ")) for c in range(0, 7)]
+lista = list(particionar(numeros, ordenar=True))
 print(f"Os valores pares digitados foram {lista[0]}")
 print(f"Os valores impares digitados são {lista[1]}")
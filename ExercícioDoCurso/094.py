@@ -1,5 +1,6 @@
+from Ex112.utilidadescev.pessoas import Pessoas
 tempo = dict()
-pessoas = list()
+pessoas = Pessoas()
 tempo["nome"] = " "
 tempo["sexo"] = " "
 cont = " "
@@ -16,31 +17,24 @@ while True:
         if cont in "SN":
             break
         print("ERRO. Respostas apenas [S/N]")
+    pessoas.adicionar(tempo["nome"], tempo["idade"], tempo["sexo"])
     if cont == "N":
-        pessoas.append(tempo.copy())
-        tempo.clear()
         break
-    pessoas.append(tempo.copy())
     tempo["nome"] = " "
     tempo["sexo"] = " "
     cont = " "
     print("-=" * 20)
-mi = 0
-for enu, c in enumerate(pessoas):
-    mi += pessoas[enu]["idade"]
-mif = mi / (enu + 1)
+mif = pessoas.media_idade()
 print(f"A) Ao todo temos {len(pessoas)} pessoas cadastradas.")
 print(f"B) A média de idade é {mif:.2f} anos.")
 print("C) As Mulheres cadastradas são: ", end=" ")
-for conjun in pessoas:
-    if conjun["sexo"] == "F":
-        print(conjun["nome"], end="... ")
+for pos in pessoas.filtrar(sexo="F"):
+    print(pessoas.nome(pos), end="... ")
 print(f"\nD) Pessoas acima da média de idade:")
-for con in pessoas:
-    if con["idade"] > mif:
-        for key, item in con.items():
-            print(f"{key} = {item}; ", end="")
-        print()
+for pos in pessoas.acima_da_media():
+    for key, item in pessoas[pos].items():
+        print(f"{key} = {item}; ", end="")
+    print()
 print("-=" * 20)
 print("     === PROGRAMA ENCERRADO ===")
 print("-=" * 20)
@@ -1,49 +1,42 @@
-gols = list()
-dados = dict()
-jogadores = list()
+from Ex112.utilidadescev.jogadores import Elenco
+elenco = Elenco()
 cont = " "
-totgols = 0
 while True:
-    dados["Nome"] = str(input("Nome do Jogador: "))
-    partidas = int(input(f"Quantas partidas {dados['Nome']} jogou? "))
-    for p in range(1, partidas + 1):
-        g = int(input(f" -Quantos gols {dados['Nome']} fez na {p}º partida: "))
-        gols.append(g)
-        totgols += g
-    dados["Gols"] = gols[:]
-    dados["Total"] = totgols
-    jogadores.append(dados.copy())
+    nome = str(input("Nome do Jogador: "))
+    partidas = int(input(f"Quantas partidas {nome} jogou? "))
+    gols = [int(input(f" -Quantos gols {nome} fez na {p}º partida: ")) for p in range(1, partidas + 1)]
+    elenco.adicionar(nome, gols)
     while cont not in "SN":
         cont = str(input("Deseja continuar (S/N): ")).strip().upper()[0]
     if cont == "N":
         break
-    gols.clear()
-    totgols = 0
     cont = " "
     print("-=" * 30)
 print("-=" * 30)
 print("Nº   ", end=" ")
-for k in dados.keys():
+for k in ("Nome", "Gols", "Total"):
     print(f"{k:<10}", end=" ")
 print()
 print("-" * 40)
-for enu, c in enumerate(jogadores):
+for enu, c in enumerate(elenco):
     print(f"{enu}    ", end=" ")
     for v in c.values():
         print(f"{str(v):<15}", end=" ")
     print()
 print("-" * 40)
 while True:
-    qual = int(input("Qual Jogador deseja ver (999 para parar): "))
-    if qual == 999:
+    qual = input("Qual Jogador deseja ver, número ou nome (999 para parar): ").strip()
+    if qual == "999":
         break
-    while qual >= len(jogadores) or qual < 0:
+    try:
+        jogador = elenco[int(qual) if qual.isnumeric() else qual]
+    except (IndexError, KeyError):
         print("Valor incorreto!!!")
-        qual = int(input("Qual Jogador deseja ver (999 para parar): "))
-    print(f"--- Sobre o jogador {jogadores[qual]['Nome']} ---")
-    for num, gol in enumerate(jogadores[qual]["Gols"]):
+        continue
+    print(f"--- Sobre o jogador {jogador['Nome']} ---")
+    for num, gol in enumerate(jogador["Gols"]):
         print(f"  -No {num + 1}º jogo ele fez {gol} gols.")
-    print(f"Ao todo {jogadores[qual]['Total']} gols")
+    print(f"Ao todo {jogador['Total']} gols")
     print("-=" * 30)
 print("-=" * 30)
 print("  <<< PROGRAMA FINALIZADO >>>")
@@ -1,3 +1,7 @@
+from Ex112.utilidadescev import faixa
+from Ex112.utilidadescev.estatistica import Estatistica
+
+
 def notas(*n, sit=False):
     """
       -> Analiza as notas do aluno e da algumas informações
@@ -6,18 +10,9 @@ def notas(*n, sit=False):
            ou se estiver em False ou não preenchida não mostra a situação do aluno
     :return: dicionário com todos os dados
     """
-    info = dict()
-    info["total"] = len(n)
-    info["maior"] = max(n)
-    info["menor"] = min(n)
-    info["média"] = sum(n) / len(n)
+    info = Estatistica(n).resultado(variancia=False)
     if sit is True:
-        if info["média"] < 6:
-            info["situação"] = "Ruim"
-        elif 6 < info["média"] < 7.5:
-            info["situação"] = "Razoável"
-        else:
-            info["situação"] = "Boa"
+        info["situação"] = faixa.DESEMPENHO.classificar(info["média"])
     return info
 
 
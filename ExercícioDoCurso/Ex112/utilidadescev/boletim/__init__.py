@@ -0,0 +1,93 @@
+from array import array
+
+
+class Aluno:
+    """
+      -> Registro compacto de um aluno: as notas ficam num array de doubles
+         e a média é atualizada a cada nota lançada (sem recalcular tudo)
+    """
+
+    __slots__ = ("id", "nome", "notas", "soma")
+
+    def __init__(self, id, nome, notas=()):
+        self.id = id
+        self.nome = nome
+        self.notas = array("d")
+        self.soma = 0.0
+        for nota in notas:
+            self.lancar(nota)
+
+    def __repr__(self):
+        return f"Aluno({self.id}, {self.nome!r}, {self.notas.tolist()})"
+
+    def lancar(self, nota):
+        self.notas.append(nota)
+        self.soma += self.notas[-1]
+
+    @property
+    def media(self):
+        return self.soma / len(self.notas) if self.notas else 0.0
+
+
+class Boletim:
+    """
+      -> Cadastro de alunos com índice por número (id) e por nome
+    """
+
+    def __init__(self):
+        self.alunos = list()
+        self._por_id = dict()
+        self._por_nome = dict()
+
+    def __len__(self):
+        return len(self.alunos)
+
+    def __iter__(self):
+        return iter(self.alunos)
+
+    def matricular(self, nome, notas=(), id=None):
+        """
+          -> Cadastra um aluno
+        :param nome: nome do aluno
+        :param notas: quantas notas quiser
+        :param id: número do aluno (o padrão é a ordem de cadastro, começando em 0)
+        :return: o Aluno cadastrado
+        """
+        if id is None:
+            id = len(self.alunos)
+        if id in self._por_id:
+            raise ValueError(f"Já existe um aluno com o número {id}")
+        aluno = Aluno(id, nome, notas)
+        self.alunos.append(aluno)
+        self._por_id[id] = aluno
+        self._por_nome.setdefault(nome, aluno)
+        return aluno
+
+    def aluno(self, ref):
+        """
+          -> Procura um aluno pelo número (int) ou pelo nome (str; se houver nomes repetidos, vale o primeiro)
+        """
+        indice = self._por_nome if isinstance(ref, str) else self._por_id
+        if ref not in indice:
+            raise KeyError(f"Aluno {ref!r} não encontrado")
+        return indice[ref]
+
+    def lancar(self, ref, nota):
+        self.aluno(ref).lancar(nota)
+
+    def media_geral(self):
+        notas = sum(len(a.notas) for a in self.alunos)
+        return sum(a.soma for a in self.alunos) / notas if notas else 0.0
+
+    def relatorio(self, saida, separador=";"):
+        """
+          -> Escreve uma linha por aluno (número, nome, média e notas), sem montar o texto todo na memória
+        :param saida: arquivo (ou qualquer objeto com write) já aberto
+        :param separador: separador das colunas
+        :return: quantidade de alunos escritos
+        """
+        saida.write(separador.join(("id", "nome", "média", "notas")) + "\n")
+        for aluno in self.alunos:
+            notas = " ".join(f"{n:.2f}" for n in aluno.notas)
+            saida.write(f"{aluno.id}{separador}{aluno.nome}{separador}{aluno.media:.2f}{separador}{notas}\n")
+        return len(self.alunos)
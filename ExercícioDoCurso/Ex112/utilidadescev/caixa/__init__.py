@@ -0,0 +1,142 @@
+from functools import lru_cache
+
+CEDULAS = (50, 20, 10, 1)
+
+
+def _ordenar(cedulas):
+    return tuple(sorted(set(cedulas), reverse=True))
+
+
+def _guloso(valor, cedulas, estoque=None):
+    notas = dict()
+    for c in cedulas:
+        quant = valor // c
+        if estoque is not None:
+            quant = min(quant, estoque.get(c, 0))
+        notas[c] = quant
+        valor -= quant * c
+    if valor != 0:
+        return None
+    return notas
+
+
+def _tabela(limite, cedulas):
+    infinito = limite + 1
+    minimo = [0] + [infinito] * limite
+    ultima = [0] * (limite + 1)
+    for v in range(1, limite + 1):
+        for c in cedulas:
+            if c <= v and minimo[v - c] + 1 < minimo[v]:
+                minimo[v] = minimo[v - c] + 1
+                ultima[v] = c
+    return minimo, ultima
+
+
+def _montar(valor, cedulas, minimo, ultima):
+    if minimo[valor] > valor:
+        return None
+    notas = dict.fromkeys(cedulas, 0)
+    while valor > 0:
+        notas[ultima[valor]] += 1
+        valor -= ultima[valor]
+    return notas
+
+
+@lru_cache(maxsize=None)
+def canonico(cedulas):
+    """
+    -> Verifica se o guloso sempre dá o menor número de cédulas
+       (basta testar os valores abaixo da soma das duas maiores cédulas)
+    :param cedulas: tupla com os valores das cédulas
+    :return: True se o sistema for canônico
+    """
+    cedulas = _ordenar(cedulas)
+    limite = sum(cedulas[:2])
+    minimo, ultima = _tabela(limite, cedulas)
+    for v in range(1, limite + 1):
+        notas = _guloso(v, cedulas)
+        if notas is None:
+            if minimo[v] <= v:
+                return False
+        elif sum(notas.values()) != minimo[v]:
+            return False
+    return True
+
+
+def _limitado(valor, cedulas, estoque):
+    itens = list()
+    for c in cedulas:
+        quant = min(estoque.get(c, 0), valor // c)
+        k = 1
+        while quant > 0:
+            parte = min(k, quant)
+            itens.append((c, parte))
+            quant -= parte
+            k *= 2
+    infinito = valor + 1
+    minimo = [0] + [infinito] * valor
+    usado = list()
+    for c, parte in itens:
+        peso = c * parte
+        marca = bytearray(valor + 1)
+        for v in range(valor, peso - 1, -1):
+            if minimo[v - peso] + parte < minimo[v]:
+                minimo[v] = minimo[v - peso] + parte
+                marca[v] = 1
+        usado.append(marca)
+    if minimo[valor] > valor:
+        return None
+    notas = dict.fromkeys(cedulas, 0)
+    v = valor
+    for pos in range(len(itens) - 1, -1, -1):
+        if usado[pos][v]:
+            c, parte = itens[pos]
+            notas[c] += parte
+            v -= c * parte
+    return notas
+
+
+def sacar(valor, cedulas=CEDULAS, estoque=None):
+    """
+    -> Calcula as cédulas de um saque com o menor número de notas
+    :param valor: valor inteiro a ser sacado
+    :param cedulas: valores das cédulas aceitas pelo caixa
+    :param estoque: dicionário {cédula: quantidade}, ou None para estoque ilimitado
+    :return: dicionário {cédula: quantidade}, ou None se o saque não for possível
+    """
+    cedulas = _ordenar(cedulas)
+    if estoque is None:
+        if canonico(cedulas):
+            return _guloso(valor, cedulas)
+        minimo, ultima = _tabela(valor, cedulas)
+        return _montar(valor, cedulas, minimo, ultima)
+    if canonico(cedulas):
+        notas = _guloso(valor, cedulas, estoque)
+        if notas is not None and all(estoque.get(c, 0) >= valor // c for c in cedulas[:-1]):
+            return notas
+    return _limitado(valor, cedulas, estoque)
+
+
+def sacar_lote(valores, cedulas=CEDULAS, estoque=None):
+    """
+    -> Processa uma sequência de saques (por exemplo, um dia inteiro do caixa)
+    :param valores: valores inteiros a serem sacados, na ordem em que chegaram
+    :param cedulas: valores das cédulas aceitas pelo caixa
+    :param estoque: dicionário {cédula: quantidade}; é atualizado a cada saque feito
+    :return: lista com o resultado de cada saque (None para os recusados)
+    """
+    cedulas = _ordenar(cedulas)
+    valores = list(valores)
+    if estoque is None:
+        if canonico(cedulas):
+            return [_guloso(v, cedulas) for v in valores]
+        minimo, ultima = _tabela(max(valores, default=0), cedulas)
+        return [_montar(v, cedulas, minimo, ultima) for v in valores]
+    saques = list()
+    for v in valores:
+        notas = sacar(v, cedulas, estoque)
+        if notas is not None:
+            for c, quant in notas.items():
+                estoque[c] = estoque.get(c, 0) - quant
+        saques.append(notas)
+    return saques
@@ -0,0 +1,69 @@
+from datetime import date
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+INICIO = 1583
+FIM = 2400
+_TABELA = bytes(a % 4 == 0 and (a % 100 != 0 or a % 400 == 0) for a in range(INICIO, FIM + 1))
+_hoje = None
+
+
+def bissexto(ano):
+    """
+      -> Verifica se o ano é bissexto pela regra do calendário gregoriano
+         (divisível por 4, menos os centenários que não são divisíveis por 400)
+    :param ano: ano a ser analisado
+    :return: True se for bissexto
+    """
+    if INICIO <= ano <= FIM:
+        return _TABELA[ano - INICIO] == 1
+    return ano % 4 == 0 and (ano % 100 != 0 or ano % 400 == 0)
+
+
+def bissextos(anos):
+    """
+      -> Verifica vários anos de uma vez
+    :param anos: sequência ou array de anos
+    :return: array de booleanos (ou lista, se o NumPy não estiver instalado)
+    """
+    if np is None:
+        return [bissexto(a) for a in anos]
+    anos = np.asarray(anos)
+    if anos.size and INICIO <= anos.min() and anos.max() <= FIM:
+        return np.frombuffer(_TABELA, dtype=np.bool_)[anos - INICIO]
+    return (anos % 4 == 0) & ((anos % 100 != 0) | (anos % 400 == 0))
+
+
+def ano_atual():
+    """
+      -> Ano de hoje, consultado uma vez só e guardado
+         (chame atualizar() se o programa atravessar a virada do ano)
+    """
+    global _hoje
+    if _hoje is None:
+        _hoje = date.today()
+    return _hoje.year
+
+
+def atualizar():
+    global _hoje
+    _hoje = None
+
+
+def idade(nascimento, ano=None):
+    """
+      -> Diferença entre o ano de nascimento e o ano de referência
+    :param nascimento: ano de nascimento (ou sequência/array de anos)
+    :param ano: ano de referência (o padrão é o ano atual)
+    :return: idade (ou lista/array de idades)
+    """
+    if ano is None:
+        ano = ano_atual()
+    if isinstance(nascimento, int):
+        return ano - nascimento
+    if np is None:
+        return [ano - n for n in nascimento]
+    return ano - np.asarray(nascimento)
@@ -0,0 +1,84 @@
+import os
+
+from .. import moeda
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+COTACOES = os.path.join(os.path.dirname(__file__), "cotacoes.txt")
+SIMBOLOS = {"BRL": "R$", "USD": "US$", "EUR": "€", "GBP": "£"}
+
+
+class Cambio:
+    """
+      -> Conversão entre moedas a partir de um arquivo local de cotações
+         ("moeda;valor em reais;atualizado em", uma moeda por linha);
+         o arquivo é lido de novo sozinho sempre que for modificado
+    :param arq: caminho do arquivo de cotações
+    """
+
+    def __init__(self, arq=COTACOES):
+        self.arq = arq
+        self._versao = None
+        self._recarregar()
+
+    def _recarregar(self):
+        versao = os.stat(self.arq).st_mtime_ns
+        if versao == self._versao:
+            return
+        codigos, reais, datas = list(), list(), dict()
+        with open(self.arq, "rt", encoding="utf-8") as a:
+            for linha in a:
+                linha = linha.strip()
+                if linha == "" or linha.startswith("#"):
+                    continue
+                codigo, valor, data = (d.strip() for d in linha.split(";"))
+                codigos.append(codigo.upper())
+                reais.append(float(valor.replace(",", ".")))
+                datas[codigo.upper()] = data
+        self.codigos = codigos
+        self.posicao = {c: i for i, c in enumerate(codigos)}
+        self.atualizado = datas
+        if np is None:
+            self.matriz = [[r / r2 for r2 in reais] for r in reais]
+        else:
+            reais = np.asarray(reais)
+            self.matriz = reais[:, None] / reais[None, :]
+        self._versao = versao
+
+    def _indice(self, codigo):
+        codigo = codigo.upper()
+        if codigo not in self.posicao:
+            raise KeyError(f"Moeda {codigo} não encontrada em {self.arq}")
+        return self.posicao[codigo]
+
+    def taxa(self, de, para):
+        """
+          -> Quanto vale 1 unidade da moeda de na moeda para
+        """
+        self._recarregar()
+        return self.matriz[self._indice(de)][self._indice(para)]
+
+    def converter(self, valor, de, para):
+        return valor * self.taxa(de, para)
+
+    def converter_lote(self, valores, de, paras):
+        """
+          -> Converte muitos valores para várias moedas de uma vez
+        :param valores: sequência ou array de valores na moeda de
+        :param de: moeda de origem (ex: "BRL")
+        :param paras: moedas de destino (ex: ("USD", "EUR", "GBP"))
+        :return: dicionário {moeda: valores convertidos}
+        """
+        self._recarregar()
+        linha = self.matriz[self._indice(de)]
+        colunas = [self._indice(p) for p in paras]
+        if np is None:
+            return {p: [v * linha[c] for v in valores] for p, c in zip(paras, colunas)}
+        tabela = np.outer(np.asarray(valores, dtype=float), linha[colunas])
+        return {p: tabela[:, n] for n, p in enumerate(paras)}
+
+    def formatar(self, valor, codigo):
+        return moeda.moeda(valor, SIMBOLOS.get(codigo.upper(), codigo.upper() + " "))
@@ -0,0 +1,104 @@
+from math import sqrt
+
+
+class Estatistica:
+    """
+      -> Acumula quantidade, soma, média, variância (Welford), menor e maior
+         sem guardar os valores; dois acumuladores podem ser juntados,
+         então cada processo pode somar a sua parte e juntar no final
+    :param valores: valores iniciais (opcional)
+    """
+
+    __slots__ = ("total", "soma", "_media", "_m2", "menor", "maior")
+
+    def __init__(self, valores=()):
+        self.total = 0
+        self.soma = 0
+        self._media = 0.0
+        self._m2 = 0.0
+        self.menor = None
+        self.maior = None
+        self.ler_varios(valores)
+
+    def __repr__(self):
+        return f"Estatistica({self.resultado()})"
+
+    def ler(self, x):
+        self.total += 1
+        self.soma += x
+        delta = x - self._media
+        self._media += delta / self.total
+        self._m2 += delta * (x - self._media)
+        if self.total == 1:
+            self.menor = self.maior = x
+        elif x < self.menor:
+            self.menor = x
+        elif x > self.maior:
+            self.maior = x
+
+    def ler_varios(self, valores):
+        for x in valores:
+            self.ler(x)
+
+    def juntar(self, outro):
+        """
+          -> Junta outro acumulador a este (fórmula de Chan para a variância)
+        :return: o próprio acumulador
+        """
+        if outro.total == 0:
+            return self
+        if self.total == 0:
+            for nome in self.__slots__:
+                setattr(self, nome, getattr(outro, nome))
+            return self
+        total = self.total + outro.total
+        delta = outro._media - self._media
+        self._m2 += outro._m2 + delta * delta * self.total * outro.total / total
+        self._media += delta * outro.total / total
+        self.total = total
+        self.soma += outro.soma
+        self.menor = min(self.menor, outro.menor)
+        self.maior = max(self.maior, outro.maior)
+        return self
+
+    def __add__(self, outro):
+        return Estatistica().juntar(self).juntar(outro)
+
+    @property
+    def media(self):
+        # a média de Welford (_media) só serve para a variância; a mostrada vem da soma exata
+        return self.soma / self.total if self.total else 0.0
+
+    def variancia(self, amostral=False):
+        if amostral:
+            return self._m2 / (self.total - 1) if self.total > 1 else 0.0
+        return self._m2 / self.total if self.total else 0.0
+
+    def desvio(self, amostral=False):
+        return sqrt(self.variancia(amostral))
+
+    def resultado(self, variancia=True):
+        """
+        :param variancia: se False, o dicionário sai sem a variância
+        """
+        info = dict()
+        info["total"] = self.total
+        info["maior"] = self.maior
+        info["menor"] = self.menor
+        info["média"] = self.media
+        if variancia:
+            info["variância"] = self.variancia()
+        return info
+
+
+def ate(leitor, parada):
+    """
+      -> Transforma leituras com valor de parada (como o 999 do 064 e do 066) num gerador
+    :param leitor: função sem parâmetros que devolve o próximo valor
+    :param parada: valor que encerra a leitura (não é devolvido)
+    """
+    while True:
+        valor = leitor()
+        if valor == parada:
+            return
+        yield valor
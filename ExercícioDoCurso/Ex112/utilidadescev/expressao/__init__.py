@@ -0,0 +1,81 @@
+import re
+
+PARES = {")": "(", "]": "[", "}": "{"}
+
+
+class Validador:
+    """
+      -> Valida os parênteses de uma expressão lida em pedaços
+         (a expressão inteira nunca precisa estar na memória)
+    :param pares: dicionário {fechamento: abertura} com os tipos aceitos
+    """
+
+    def __init__(self, pares=PARES):
+        self.abre = "".join(pares.values())
+        self.fecha = "".join(pares.keys())
+        self.tipo = {c: n for n, c in enumerate(self.abre)}
+        self.tipo.update({c: self.abre.index(a) for c, a in pares.items()})
+        self.busca = re.compile(f"[{re.escape(self.abre + self.fecha)}]")
+        self.pilha = bytearray()
+        self.inicio = 0
+        self.lidos = 0
+        self.erro = None
+
+    def ler(self, pedaco):
+        if self.erro is not None:
+            return False
+        for m in self.busca.finditer(pedaco):
+            c = m.group()
+            pos = self.lidos + m.start()
+            if c in self.abre:
+                if not self.pilha:
+                    self.inicio = pos
+                self.pilha.append(self.tipo[c])
+            elif not self.pilha or self.pilha.pop() != self.tipo[c]:
+                self.erro = pos
+                return False
+        self.lidos += len(pedaco)
+        return True
+
+    def fim(self):
+        """
+        :return: tupla (válida, posição do primeiro erro ou None)
+        """
+        if self.erro is not None:
+            return False, self.erro
+        if self.pilha:
+            return False, self.inicio
+        return True, None
+
+
+def validar(expressao, pares=PARES):
+    """
+      -> Valida uma expressão inteira ou uma sequência de pedaços dela
+    :param expressao: string, ou qualquer iterável de strings
+    :param pares: dicionário {fechamento: abertura} com os tipos aceitos
+    :return: tupla (válida, posição do primeiro erro ou None)
+    """
+    v = Validador(pares)
+    if isinstance(expressao, str):
+        expressao = (expressao,)
+    for pedaco in expressao:
+        if not v.ler(pedaco):
+            break
+    return v.fim()
+
+
+def validar_fluxo(fluxo, pares=PARES, tamanho=1 << 20):
+    pedacos = iter(lambda: fluxo.read(tamanho), "")
+    return validar(pedacos, pares)
+
+
+def validar_arquivo(arq, pares=PARES, tamanho=1 << 20):
+    """
+      -> Valida a expressão de um arquivo de texto, lendo aos poucos
+    :param arq: caminho do arquivo
+    :param pares: dicionário {fechamento: abertura} com os tipos aceitos
+    :param tamanho: quantidade de caracteres lidos por vez
+    :return: tupla (válida, posição do primeiro erro ou None)
+    """
+    with open(arq, "rt", encoding="utf-8") as a:
+        return validar_fluxo(a, pares, tamanho)
@@ -0,0 +1,74 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Extremos:
+    """
+      -> Acompanha o menor e o maior valor (e todas as posições deles)
+         de uma sequência que chega um valor de cada vez
+    :param key: função que dá o valor usado na comparação (como no min/max)
+    """
+
+    def __init__(self, key=None):
+        self.key = key
+        self.total = 0
+        self.menor = self.maior = None
+        self._kmenor = self._kmaior = None
+        self.pos_menor = list()
+        self.pos_maior = list()
+
+    def ler(self, valor):
+        k = valor if self.key is None else self.key(valor)
+        pos = self.total
+        self.total += 1
+        if pos == 0:
+            self.menor = self.maior = valor
+            self._kmenor = self._kmaior = k
+            self.pos_menor.append(pos)
+            self.pos_maior.append(pos)
+            return
+        if k < self._kmenor:
+            self.menor, self._kmenor = valor, k
+            self.pos_menor = [pos]
+        elif k == self._kmenor:
+            self.pos_menor.append(pos)
+        if k > self._kmaior:
+            self.maior, self._kmaior = valor, k
+            self.pos_maior = [pos]
+        elif k == self._kmaior:
+            self.pos_maior.append(pos)
+
+    def resultado(self):
+        info = dict()
+        info["total"] = self.total
+        info["menor"] = self.menor
+        info["posições do menor"] = self.pos_menor[:]
+        info["maior"] = self.maior
+        info["posições do maior"] = self.pos_maior[:]
+        return info
+
+
+def extremos(valores, key=None):
+    """
+      -> Acha o menor e o maior valor e as posições deles numa passada só
+    :param valores: qualquer iterável (lista, gerador, arquivo...) ou array do NumPy
+    :param key: função que dá o valor usado na comparação (como no min/max)
+    :return: dicionário com o total, o menor, o maior e as listas de posições de cada um
+    """
+    if np is not None and key is None and isinstance(valores, np.ndarray):
+        valores = valores.ravel()
+        if valores.size == 0:
+            return Extremos().resultado()
+        info = dict()
+        info["total"] = valores.size
+        info["menor"] = valores[valores.argmin()].item()
+        info["posições do menor"] = np.flatnonzero(valores == info["menor"]).tolist()
+        info["maior"] = valores[valores.argmax()].item()
+        info["posições do maior"] = np.flatnonzero(valores == info["maior"]).tolist()
+        return info
+    e = Extremos(key)
+    for v in valores:
+        e.ler(v)
+    return e.resultado()
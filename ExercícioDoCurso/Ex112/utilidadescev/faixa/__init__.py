@@ -0,0 +1,93 @@
+from bisect import bisect_left, bisect_right
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Faixas:
+    """
+      -> Tabela de faixas: classifica um valor procurando (com bisect)
+         em qual intervalo entre os limites ele cai
+    :param limites: limites das faixas, em ordem crescente
+    :param rotulos: um rótulo por faixa (um a mais que os limites)
+    :param fechado: "direita" se o limite pertence à faixa de baixo (x <= limite),
+                    "esquerda" se pertence à faixa de cima (x < limite)
+    """
+
+    def __init__(self, limites, rotulos, fechado="direita"):
+        if len(rotulos) != len(limites) + 1:
+            raise ValueError("É preciso um rótulo a mais que a quantidade de limites")
+        if list(limites) != sorted(limites):
+            raise ValueError("Os limites precisam estar em ordem crescente")
+        if fechado not in ("direita", "esquerda"):
+            raise ValueError("fechado precisa ser 'direita' ou 'esquerda'")
+        self.limites = tuple(limites)
+        self.rotulos = tuple(rotulos)
+        self.fechado = fechado
+        self._busca = bisect_left if fechado == "direita" else bisect_right
+
+    def indice(self, x):
+        return self._busca(self.limites, x)
+
+    def classificar(self, x):
+        return self.rotulos[self._busca(self.limites, x)]
+
+    def indices_lote(self, valores):
+        if np is None:
+            return [self._busca(self.limites, x) for x in valores]
+        lado = "left" if self.fechado == "direita" else "right"
+        return np.searchsorted(np.asarray(self.limites), np.asarray(valores), side=lado)
+
+    def classificar_lote(self, valores):
+        """
+          -> Classifica muitos valores de uma vez
+        :param valores: sequência ou array de valores
+        :return: array de rótulos (ou lista, se o NumPy não estiver instalado)
+        """
+        pos = self.indices_lote(valores)
+        if np is None:
+            return [self.rotulos[p] for p in pos]
+        return np.asarray(self.rotulos)[pos]
+
+
+IMC = Faixas((18.5, 25, 30, 40),
+             ("Você está Abaixo do peso!", "Você está no Peso ideal!", "Você está acima do peso!",
+              "Você está Obeso!", "Você tem Obesidade Mórbida!!!"))
+ATLETA = Faixas((9, 14, 19, 25), ("Mirim", "Infantil", "Júnior", "Sênior", "Master"))
+NOTA = Faixas((5.75, 6), ("Recuperação", "Passou no Limite", "Passou"), fechado="esquerda")
+AUMENTO = Faixas((1000, 2000, 7000), (50, 30, 10, 5))
+SITUACAO = Faixas((5, 7), ("Reprovado", "Recuperação", "Aprovado"), fechado="esquerda")
+DESEMPENHO = Faixas((6, 7.5), ("Ruim", "Razoável", "Boa"), fechado="esquerda")
+
+
+def carregar(arq):
+    """
+      -> Lê tabelas de faixas de um arquivo de texto no formato:
+            [imc] direita
+            18.5;Abaixo do peso
+            25;Peso ideal
+            ;Obeso
+         (uma linha "limite;rótulo" por faixa; a última faixa fica sem limite)
+    :param arq: caminho do arquivo
+    :return: dicionário {nome da tabela: Faixas}
+    """
+    tabelas = dict()
+    nome = None
+    with open(arq, "rt", encoding="utf-8") as a:
+        for linha in a:
+            linha = linha.strip()
+            if linha == "" or linha.startswith("#"):
+                continue
+            if linha.startswith("["):
+                nome, _, fechado = linha[1:].partition("]")
+                tabelas[nome] = ([], [], fechado.strip() or "direita")
+            elif nome is None:
+                raise ValueError(f"Linha '{linha}' fora de uma tabela")
+            else:
+                limite, rotulo = linha.split(";", 1)
+                if limite.strip() != "":
+                    tabelas[nome][0].append(float(limite.replace(",", ".")))
+                tabelas[nome][1].append(rotulo.strip())
+    return {n: Faixas(lim, rot, fec) for n, (lim, rot, fec) in tabelas.items()}
@@ -0,0 +1,122 @@
+from array import array
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+PRICE = "price"
+SAC = "sac"
+COMPROMETIMENTO = 0.3
+
+
+def taxa_mensal(anual):
+    """
+      -> Converte uma taxa anual (0.12 = 12% ao ano) na taxa mensal equivalente
+    """
+    return (1 + anual) ** (1 / 12) - 1
+
+
+def parcela_price(valor, taxa, meses):
+    """
+      -> Parcela fixa da tabela Price
+    :param valor: valor financiado (número ou array)
+    :param taxa: juros ao mês (0.01 = 1%)
+    :param meses: quantidade de parcelas (número ou array)
+    """
+    if taxa == 0:
+        return valor / meses
+    return valor * taxa / (1 - (1 + taxa) ** -meses)
+
+
+def primeira_parcela(valor, taxa, meses, sistema=PRICE):
+    """
+      -> A maior parcela do financiamento (no SAC é a primeira; na Price são todas iguais)
+    """
+    if sistema == PRICE:
+        return parcela_price(valor, taxa, meses)
+    if sistema == SAC:
+        return valor / meses + valor * taxa
+    raise ValueError(f"Sistema de amortização desconhecido: {sistema}")
+
+
+def tabela(valor, taxa, meses, sistema=PRICE):
+    """
+      -> Gera a tabela de amortização uma linha por vez, sem montar a tabela inteira
+    :param valor: valor financiado
+    :param taxa: juros ao mês
+    :param meses: quantidade de parcelas
+    :param sistema: PRICE (parcelas iguais) ou SAC (amortização constante)
+    :return: gerador de tuplas (mês, parcela, juros, amortização, saldo devedor)
+    """
+    if sistema == PRICE:
+        fixa = parcela_price(valor, taxa, meses)
+    elif sistema == SAC:
+        amortizacao = valor / meses
+    else:
+        raise ValueError(f"Sistema de amortização desconhecido: {sistema}")
+    saldo = valor
+    for mes in range(1, meses + 1):
+        juros = saldo * taxa
+        if sistema == PRICE:
+            amortizacao = fixa - juros
+        if mes == meses:
+            amortizacao = saldo
+        saldo -= amortizacao
+        yield mes, amortizacao + juros, juros, amortizacao, saldo
+
+
+def avaliar(casas, salarios, anos, taxa=0.0, sistema=PRICE, comprometimento=COMPROMETIMENTO):
+    """
+      -> Verifica para muitos pedidos de uma vez se a maior parcela cabe no salário
+    :param casas: valores dos imóveis (número, sequência ou array)
+    :param salarios: salários de cada pedido
+    :param anos: prazos em anos
+    :param taxa: juros ao mês
+    :param sistema: PRICE ou SAC
+    :param comprometimento: parte do salário que pode ir para a parcela
+    :return: tupla (pode pagar, parcela, folga); a folga é negativa quando falta dinheiro
+    """
+    if isinstance(casas, (int, float)):
+        parcela = primeira_parcela(casas, taxa, anos * 12, sistema)
+        folga = salarios * comprometimento - parcela
+        return bool(folga >= 0), parcela, folga
+    if np is None:
+        resultados = [avaliar(c, s, a, taxa, sistema, comprometimento) for c, s, a in zip(casas, salarios, anos)]
+        return (array("b", (r[0] for r in resultados)),
+                array("d", (r[1] for r in resultados)),
+                array("d", (r[2] for r in resultados)))
+    casas = np.asarray(casas, dtype=float)
+    meses = np.asarray(anos, dtype=float) * 12
+    parcela = primeira_parcela(casas, taxa, meses, sistema)
+    folga = np.asarray(salarios, dtype=float) * comprometimento - parcela
+    return folga >= 0, parcela, folga
+
+
+def _avaliar(tarefa):
+    return avaliar(*tarefa)
+
+
+def avaliar_paralelo(casas, salarios, anos, taxa=0.0, sistema=PRICE, comprometimento=COMPROMETIMENTO,
+                     processos=2, bloco=1_000_000):
+    """
+      -> Mesmo que avaliar, mas dividindo os pedidos em blocos entre vários processos
+    :return: tupla (pode pagar, parcela, folga) na mesma ordem dos pedidos
+    """
+    tarefas = [(casas[ini:ini + bloco], salarios[ini:ini + bloco], anos[ini:ini + bloco],
+                taxa, sistema, comprometimento) for ini in range(0, len(casas), bloco)]
+    if processos == 1 or len(tarefas) <= 1:
+        resultados = [_avaliar(t) for t in tarefas]
+    else:
+        with Pool(processos) as pool:
+            resultados = pool.map(_avaliar, tarefas)
+    if np is None:
+        saida = (array("b"), array("d"), array("d"))
+        for r in resultados:
+            for s, parte in zip(saida, r):
+                s.extend(parte)
+        return saida
+    if not resultados:
+        return np.empty(0, dtype=bool), np.empty(0), np.empty(0)
+    return tuple(np.concatenate(col) for col in zip(*resultados))
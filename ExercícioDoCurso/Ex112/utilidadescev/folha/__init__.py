@@ -0,0 +1,151 @@
+import re
+from array import array
+from decimal import Decimal, InvalidOperation, ROUND_HALF_UP
+from itertools import islice
+
+from .. import faixa
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_MILHARES = re.compile(r"[+-]?\d{1,3}(\.\d{3})+")
+_NOMES_SALARIO = ("salario", "salário")
+
+
+def centavos(valor):
+    """
+      -> Converte um valor em reais ("1.500,50", "1.500", "1500.50" ou número) para centavos exatos;
+         sem vírgula, o ponto só é decimal se não separar grupos de três dígitos
+    """
+    original = valor
+    if isinstance(valor, str):
+        valor = valor.strip().replace("R$", "").strip()
+        if "," in valor:
+            valor = valor.replace(".", "").replace(",", ".")
+        elif _MILHARES.fullmatch(valor):
+            valor = valor.replace(".", "")
+        elif valor.count(".") > 1:
+            raise ValueError(f"Valor em reais inválido: {original!r}")
+    try:
+        return int((Decimal(str(valor)) * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+    except (InvalidOperation, ValueError):
+        raise ValueError(f"Valor em reais inválido: {original!r}") from None
+
+
+def reais(cent):
+    """
+      -> Escreve centavos como reais com ponto decimal ("1500.50")
+    """
+    sinal = "-" if cent < 0 else ""
+    cent = abs(cent)
+    return f"{sinal}{cent // 100}.{cent % 100:02d}"
+
+
+def aumentar(cent, taxa):
+    """
+      -> Mesmo cálculo do moeda.aumentar, mas em centavos e com arredondamento exato
+    :param cent: valor em centavos
+    :param taxa: porcentagem do aumento (inteira)
+    :return: novo valor em centavos
+    """
+    return (cent * (100 + taxa) + 50) // 100
+
+
+def reajustar(salarios, tabela=faixa.AUMENTO):
+    """
+      -> Aplica o aumento da faixa de cada salário
+    :param salarios: sequência ou array de salários em centavos
+    :param tabela: Faixas com limites em reais e a taxa de cada faixa como rótulo
+    :return: novos salários em centavos (array, ou lista sem o NumPy)
+    """
+    if np is None:
+        return [aumentar(c, tabela.classificar(c / 100)) for c in salarios]
+    salarios = np.asarray(salarios, dtype=np.int64)
+    taxas = np.asarray(tabela.rotulos, dtype=np.int64)[tabela.indices_lote(salarios / 100)]
+    return (salarios * (100 + taxas) + 50) // 100
+
+
+def _blocos(iteravel, tamanho):
+    iteravel = iter(iteravel)
+    while True:
+        bloco = list(islice(iteravel, tamanho))
+        if not bloco:
+            return
+        yield bloco
+
+
+def _linha(numero, linha):
+    campos = linha.rstrip("\n").rsplit(";", 1)
+    try:
+        if len(campos) != 2:
+            raise ValueError
+        return campos[0], centavos(campos[1])
+    except ValueError:
+        raise ValueError(f"Linha {numero} inválida (esperado \"nome;salário\"): {linha.strip()!r}") from None
+
+
+def _eh_cabecalho(linha):
+    campos = linha.rstrip("\n").rsplit(";", 1)
+    return len(campos) == 2 and campos[1].strip().lower() in _NOMES_SALARIO
+
+
+def processar_csv(entrada, saida, tabela=faixa.AUMENTO, bloco=100_000, cabecalho=None):
+    """
+      -> Lê um arquivo "nome;salário" e grava "nome;salário;novo salário",
+         processando e gravando um bloco de linhas por vez
+    :param entrada: caminho do arquivo de entrada
+    :param saida: caminho do arquivo de saída
+    :param tabela: Faixas com as taxas de aumento
+    :param bloco: quantidade de linhas por bloco
+    :param cabecalho: True se a primeira linha for cabeçalho, False se não for; com None,
+                      ela só é cabeçalho se a última coluna se chamar "salário" (ou "salario").
+                      O cabeçalho é copiado com a coluna nova; qualquer outra linha inválida dá erro
+    :return: quantidade de linhas processadas (sem contar o cabeçalho)
+    """
+    total = 0
+    with open(entrada, "rt", encoding="utf-8") as e, open(saida, "wt", encoding="utf-8") as s:
+        primeira = e.readline()
+        if cabecalho is None:
+            cabecalho = _eh_cabecalho(primeira)
+        if cabecalho:
+            s.write(f"{primeira.rstrip()};novo salário\n")
+            inicio = 2
+        else:
+            e.seek(0)
+            inicio = 1
+        for linhas in _blocos(enumerate(e, inicio), bloco):
+            dados = [_linha(n, linha) for n, linha in linhas if linha.strip()]
+            novos = reajustar([a for nome, a in dados], tabela)
+            s.writelines(f"{nome};{reais(a)};{reais(int(n))}\n"
+                         for (nome, a), n in zip(dados, novos))
+            total += len(dados)
+    return total
+
+
+def processar_coluna(entrada, saida, tabela=faixa.AUMENTO, bloco=1 << 20):
+    """
+      -> Mesmo processamento para arquivos de coluna binária
+         (inteiros de 64 bits com os salários em centavos, um atrás do outro)
+    :param entrada: caminho da coluna de salários
+    :param saida: caminho da coluna de novos salários
+    :param tabela: Faixas com as taxas de aumento
+    :param bloco: quantidade de salários por bloco
+    :return: quantidade de salários processados
+    """
+    total = 0
+    with open(entrada, "rb") as e, open(saida, "wb") as s:
+        while True:
+            if np is not None:
+                dados = np.fromfile(e, dtype=np.int64, count=bloco)
+                if dados.size == 0:
+                    break
+                reajustar(dados, tabela).astype(np.int64).tofile(s)
+            else:
+                dados = array("q", e.read(bloco * 8))
+                if not dados:
+                    break
+                array("q", reajustar(dados, tabela)).tofile(s)
+            total += len(dados)
+    return total
@@ -0,0 +1,106 @@
+import math
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+TIPOS = ("Inválido", "Equilátero", "Isósceles", "Escaleno")
+
+
+def _seno(g):
+    if g % 90 == 0:
+        return float((0, 1, 0, -1)[g // 90 % 4])
+    return math.sin(math.radians(g))
+
+
+def _cosseno(g):
+    if g % 90 == 0:
+        return float((1, 0, -1, 0)[g // 90 % 4])
+    return math.cos(math.radians(g))
+
+
+def _tangente(g):
+    if g % 180 == 90:
+        return math.inf
+    if g % 180 == 0:
+        return 0.0
+    return math.tan(math.radians(g))
+
+
+SENOS = tuple(_seno(g) for g in range(360))
+COSSENOS = tuple(_cosseno(g) for g in range(360))
+TANGENTES = tuple(_tangente(g) for g in range(360))
+
+
+def triangulo(l1, l2, l3):
+    """
+      -> Verifica se as três medidas formam um triângulo
+    """
+    return l1 + l2 > l3 and l1 + l3 > l2 and l2 + l3 > l1 and min(l1, l2, l3) > 0
+
+
+def tipo_triangulo(l1, l2, l3):
+    """
+    :return: "Equilátero", "Isósceles", "Escaleno" ou "Inválido" (se não formar triângulo)
+    """
+    if not triangulo(l1, l2, l3):
+        return TIPOS[0]
+    if l1 == l2 == l3:
+        return TIPOS[1]
+    if l1 == l2 or l1 == l3 or l2 == l3:
+        return TIPOS[2]
+    return TIPOS[3]
+
+
+def classificar_lote(lados):
+    """
+      -> Valida e classifica muitos triângulos de uma vez
+    :param lados: sequência de trios (l1, l2, l3), ou array com 3 colunas
+    :return: códigos (índices de TIPOS): 0 inválido, 1 equilátero, 2 isósceles, 3 escaleno
+    """
+    if np is None:
+        return [TIPOS.index(tipo_triangulo(*t)) for t in lados]
+    lados = np.sort(np.asarray(lados, dtype=float).reshape(-1, 3), axis=1)
+    a, b, c = lados[:, 0], lados[:, 1], lados[:, 2]
+    valido = (a > 0) & (a + b > c)
+    iguais = (a == b).astype(np.int8) + (b == c)
+    codigos = np.where(iguais == 2, 1, np.where(iguais == 1, 2, 3)).astype(np.int8)
+    codigos[~valido] = 0
+    return codigos
+
+
+def hipotenusa_lote(catetos1, catetos2):
+    if np is None:
+        return [math.hypot(a, b) for a, b in zip(catetos1, catetos2)]
+    return np.hypot(np.asarray(catetos1, dtype=float), np.asarray(catetos2, dtype=float))
+
+
+def trig(graus):
+    """
+      -> Seno, cosseno e tangente de um ângulo em graus
+         (ângulos inteiros saem da tabela pronta; a tangente de 90° e 270° é infinita)
+    :return: tupla (seno, cosseno, tangente)
+    """
+    if graus == int(graus):
+        g = int(graus) % 360
+        return SENOS[g], COSSENOS[g], TANGENTES[g]
+    r = math.radians(graus)
+    return math.sin(r), math.cos(r), math.tan(r)
+
+
+def trig_lote(graus):
+    """
+      -> Seno, cosseno e tangente de muitos ângulos
+    :param graus: sequência ou array de ângulos em graus
+    :return: tupla (senos, cossenos, tangentes)
+    """
+    if np is None:
+        valores = [trig(g) for g in graus]
+        return tuple(list(col) for col in zip(*valores)) if valores else ([], [], [])
+    graus = np.asarray(graus)
+    if np.issubdtype(graus.dtype, np.integer):
+        g = graus % 360
+        return np.asarray(SENOS)[g], np.asarray(COSSENOS)[g], np.asarray(TANGENTES)[g]
+    r = np.radians(graus)
+    return np.sin(r), np.cos(r), np.tan(r)
@@ -0,0 +1,97 @@
+import heapq
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Elenco:
+    """
+      -> Jogadores e gols guardados em arrays: todos os gols ficam num único
+         array, e cada jogador guarda só onde começam os seus gols, em quantas
+         partidas jogou e o total (que já fica calculado)
+    """
+
+    def __init__(self):
+        self.nomes = list()
+        self._posicao = dict()
+        self.gols = array("I")
+        self.inicio = array("Q")
+        self.partidas = array("I")
+        self.totais = array("Q")
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def adicionar(self, nome, gols):
+        """
+          -> Cadastra um jogador com os gols de cada partida
+        :param nome: nome do jogador
+        :param gols: gols em cada partida, em ordem
+        :return: número (posição) do jogador
+        """
+        antes = len(self.gols)
+        self.gols.extend(gols)
+        self.inicio.append(antes)
+        self.partidas.append(len(self.gols) - antes)
+        self.totais.append(sum(self.gols[antes:]))
+        self.nomes.append(nome)
+        self._posicao.setdefault(nome, len(self.nomes) - 1)
+        return len(self.nomes) - 1
+
+    def indice(self, jogador):
+        """
+          -> Aceita o número do jogador ou o nome (se houver nomes repetidos, vale o primeiro)
+        """
+        if isinstance(jogador, str):
+            if jogador not in self._posicao:
+                raise KeyError(f"Jogador '{jogador}' não cadastrado")
+            return self._posicao[jogador]
+        if not 0 <= jogador < len(self):
+            raise IndexError(f"Jogador {jogador} não cadastrado")
+        return jogador
+
+    def gols_de(self, jogador):
+        i = self.indice(jogador)
+        return self.gols[self.inicio[i]:self.inicio[i] + self.partidas[i]]
+
+    def __getitem__(self, jogador):
+        i = self.indice(jogador)
+        return {"Nome": self.nomes[i], "Gols": self.gols_de(i).tolist(), "Total": self.totais[i]}
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def artilheiros(self, k=10):
+        """
+        :return: lista de tuplas (nome, total de gols) dos k jogadores que mais marcaram
+                 (no empate, fica na frente quem foi cadastrado primeiro)
+        """
+        if np is None:
+            melhores = heapq.nlargest(k, range(len(self)), key=self.totais.__getitem__)
+        else:
+            totais = np.frombuffer(self.totais, dtype=np.uint64)
+            k = min(k, totais.size)
+            if k == 0:
+                return []
+            corte = np.partition(totais, totais.size - k)[totais.size - k]
+            acima = np.flatnonzero(totais > corte)
+            empatados = np.flatnonzero(totais == corte)[:k - acima.size]
+            melhores = np.concatenate((acima, empatados))
+            melhores = melhores[np.lexsort((melhores, -totais[melhores].astype(np.int64)))].tolist()
+        return [(self.nomes[i], self.totais[i]) for i in melhores]
+
+    def media_por_partida(self):
+        """
+        :return: média de gols por partida de cada jogador (0 para quem não jogou)
+        """
+        if np is None:
+            return [t / p if p else 0.0 for t, p in zip(self.totais, self.partidas)]
+        totais = np.frombuffer(self.totais, dtype=np.uint64)
+        partidas = np.frombuffer(self.partidas, dtype=np.uint32)
+        media = np.zeros(len(self))
+        np.divide(totais, partidas, out=media, where=partidas > 0)
+        return media
@@ -0,0 +1,116 @@
+import random
+from array import array
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMEROS = 60
+DEZENAS = 6
+
+
+def bilhete(rng=random):
+    """
+      -> Sorteia um jogo da Mega Sena sem repetir números (sem ficar sorteando de novo)
+    :param rng: gerador do módulo random (ou random.Random com semente)
+    :return: lista ordenada com as dezenas
+    """
+    return sorted(rng.sample(range(1, NUMEROS + 1), DEZENAS))
+
+
+def mascara(dezenas):
+    """
+      -> Guarda um jogo num único inteiro: o bit n - 1 ligado quer dizer que o número n foi escolhido
+    """
+    m = 0
+    for d in dezenas:
+        m |= 1 << (d - 1)
+    return m
+
+
+def dezenas(m):
+    """
+      -> Volta da máscara para a lista de números
+    """
+    return [n + 1 for n in range(NUMEROS) if m >> n & 1]
+
+
+def _gerar(tarefa):
+    quant, semente, bloco = tarefa
+    if np is None:
+        rng = random.Random(semente)
+        return array("Q", (mascara(rng.sample(range(1, NUMEROS + 1), DEZENAS)) for _ in range(quant)))
+    rng = np.random.default_rng(semente)
+    bits = np.uint64(1) << np.arange(NUMEROS, dtype=np.uint64)
+    saida = np.empty(quant, dtype=np.uint64)
+    for ini in range(0, quant, bloco):
+        n = min(bloco, quant - ini)
+        escolhidos = rng.random((n, NUMEROS)).argpartition(DEZENAS, axis=1)[:, :DEZENAS]
+        saida[ini:ini + n] = np.bitwise_or.reduce(bits[escolhidos], axis=1)
+    return saida
+
+
+def gerar(quant, semente=None, processos=1, bloco=100_000):
+    """
+      -> Gera muitos jogos já no formato de máscara (60 bits por jogo)
+    :param quant: quantidade de jogos
+    :param semente: semente para repetir os mesmos jogos
+    :param processos: quantidade de processos; cada um tem sua própria semente
+    :param bloco: jogos sorteados de uma vez em cada processo
+    :return: array de inteiros de 64 bits (array do NumPy, ou array('Q') sem ele)
+    """
+    if np is None:
+        gerador = random.Random(semente)
+        sementes = [gerador.getrandbits(64) for _ in range(processos)]
+    else:
+        sementes = np.random.SeedSequence(semente).spawn(processos)
+    partes = [quant // processos + (p < quant % processos) for p in range(processos)]
+    tarefas = [(n, s, bloco) for n, s in zip(partes, sementes)]
+    if processos == 1:
+        resultados = [_gerar(tarefas[0])]
+    else:
+        with Pool(processos) as pool:
+            resultados = pool.map(_gerar, tarefas)
+    if np is None:
+        saida = array("Q")
+        for r in resultados:
+            saida.extend(r)
+        return saida
+    return np.concatenate(resultados)
+
+
+def gravar(arq, mascaras):
+    with open(arq, "wb") as a:
+        mascaras.tofile(a)
+
+
+def ler(arq):
+    if np is None:
+        saida = array("Q")
+        with open(arq, "rb") as a:
+            saida.frombytes(a.read())
+        return saida
+    return np.fromfile(arq, dtype=np.uint64)
+
+
+def conferir(mascaras, sorteio):
+    """
+      -> Confere os jogos contra um sorteio
+    :param mascaras: jogos no formato de máscara
+    :param sorteio: números sorteados
+    :return: tupla (acertos de cada jogo, quantidade de jogos por número de acertos)
+    """
+    alvo = mascara(sorteio)
+    if np is None:
+        acertos = array("B", (bin(m & alvo).count("1") for m in mascaras))
+        resumo = [0] * (DEZENAS + 1)
+        for a in acertos:
+            resumo[a] += 1
+        return acertos, resumo
+    mascaras = np.asarray(mascaras, dtype=np.uint64)
+    acertos = np.zeros(mascaras.shape, dtype=np.uint8)
+    for d in set(sorteio):
+        acertos += ((mascaras >> np.uint64(d - 1)) & np.uint64(1)).astype(np.uint8)
+    return acertos, np.bincount(acertos, minlength=DEZENAS + 1).tolist()
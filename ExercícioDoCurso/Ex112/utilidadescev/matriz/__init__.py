@@ -0,0 +1,140 @@
+from array import array
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+@lru_cache(maxsize=64)
+def _formato(colunas, modelo):
+    return modelo * colunas
+
+
+class Matriz:
+    """
+      -> Matriz de qualquer tamanho guardada num único array (linha após linha);
+         as somas e os máximos usam o NumPy direto sobre esse array, quando ele existe
+    :param linhas: quantidade de linhas
+    :param colunas: quantidade de colunas
+    :param valores: valores em ordem de linha (o padrão é tudo zero)
+    :param tipo: "q" para inteiros, "d" para números reais
+                 (se valores já for um array, vale o tipo dele)
+    """
+
+    def __init__(self, linhas, colunas, valores=None, tipo="q"):
+        self.linhas = linhas
+        self.colunas = colunas
+        if isinstance(valores, array):
+            tipo = valores.typecode
+            self.dados = valores
+        elif valores is None:
+            self.dados = array(tipo, bytes(linhas * colunas * array(tipo).itemsize))
+        else:
+            self.dados = array(tipo, valores)
+        self.tipo = tipo
+        if len(self.dados) != linhas * colunas:
+            raise ValueError(f"São precisos {linhas * colunas} valores para uma matriz {linhas}x{colunas}")
+
+    def _pos(self, pos):
+        i, j = pos
+        if not (0 <= i < self.linhas and 0 <= j < self.colunas):
+            raise IndexError(f"Posição [{i}, {j}] fora da matriz")
+        return i * self.colunas + j
+
+    def __getitem__(self, pos):
+        return self.dados[self._pos(pos)]
+
+    def __setitem__(self, pos, valor):
+        self.dados[self._pos(pos)] = valor
+
+    def _linha(self, i):
+        if not 0 <= i < self.linhas:
+            raise IndexError(f"Linha {i} fora da matriz")
+        return i
+
+    def _coluna(self, j):
+        if not 0 <= j < self.colunas:
+            raise IndexError(f"Coluna {j} fora da matriz")
+        return j
+
+    def linha(self, i):
+        i = self._linha(i)
+        return self.dados[i * self.colunas:(i + 1) * self.colunas]
+
+    def coluna(self, j):
+        return self.dados[self._coluna(j)::self.colunas]
+
+    def _np(self):
+        return np.frombuffer(self.dados, dtype=self.tipo).reshape(self.linhas, self.colunas)
+
+    def soma(self, condicao=None):
+        """
+          -> Soma os valores da matriz
+        :param condicao: função que diz quais valores entram na soma; precisa funcionar
+                         tanto com um número quanto com um array (ex: lambda v: v % 2 == 0)
+        """
+        if np is not None:
+            m = self._np()
+            return (m[condicao(m)] if condicao else m).sum().item()
+        return sum(v for v in self.dados if condicao is None or condicao(v))
+
+    def soma_pares(self):
+        return self.soma(lambda v: v % 2 == 0)
+
+    def somas_colunas(self):
+        if np is not None:
+            return self._np().sum(axis=0).tolist()
+        return [sum(self.coluna(j)) for j in range(self.colunas)]
+
+    def soma_coluna(self, j):
+        if np is not None:
+            return self._np()[:, self._coluna(j)].sum().item()
+        return sum(self.coluna(j))
+
+    def maiores_linhas(self):
+        if np is not None:
+            return self._np().max(axis=1).tolist()
+        return [max(self.linha(i)) for i in range(self.linhas)]
+
+    def maior_da_linha(self, i):
+        if np is not None:
+            return self._np()[self._linha(i)].max().item()
+        return max(self.linha(i))
+
+    def formatar(self, modelo="[{:^5}]"):
+        """
+          -> Gera o texto da matriz, uma linha de cada vez
+        :param modelo: formato de cada valor (o modelo da linha inteira fica guardado em cache)
+        """
+        formato = _formato(self.colunas, modelo)
+        for i in range(self.linhas):
+            yield formato.format(*self.linha(i))
+
+    def mostrar(self, modelo="[{:^5}]"):
+        for texto in self.formatar(modelo):
+            print(texto)
+
+
+def ler(fluxo, tipo="q"):
+    """
+      -> Lê uma matriz de um texto com uma linha por linha da matriz e os valores separados por espaços
+    :param fluxo: arquivo aberto (ou qualquer iterável de linhas)
+    :param tipo: "q" para inteiros, "d" para números reais
+    :return: Matriz
+    """
+    converter = int if tipo == "q" else float
+    dados = array(tipo)
+    linhas = colunas = 0
+    for texto in fluxo:
+        valores = texto.split()
+        if not valores:
+            continue
+        if linhas == 0:
+            colunas = len(valores)
+        elif len(valores) != colunas:
+            raise ValueError(f"A linha {linhas + 1} tem {len(valores)} valores, eram esperados {colunas}")
+        dados.extend(map(converter, valores))
+        linhas += 1
+    return Matriz(linhas, colunas, dados, tipo)
@@ -40,8 +40,8 @@ def diminuir(n, taxa, formatador):
         return tot
 
 
-def moeda(num):
-    n = f"R${num:.2f}"
+def moeda(num, simbolo="R$"):
+    n = f"{simbolo}{num:.2f}"
     c = n.replace(".", ",")
     return c
 
@@ -0,0 +1,105 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ALFABETO = "0123456789abcdefghijklmnopqrstuvwxyz"
+CLASSES = ("", "Milhar", "Milhão", "Bilhão", "Trilhão", "Quatrilhão", "Quintilhão")
+
+
+def nome_casa(pos):
+    """
+      -> Nome da casa decimal na posição pos (0 = Unidade, 3 = Milhar, ...)
+    """
+    ordem, classe = pos % 3, pos // 3
+    if classe == 0:
+        return ("Unidade", "Dezena", "Centena")[ordem]
+    if classe < len(CLASSES):
+        nome = CLASSES[classe]
+    else:
+        nome = f"10^{classe * 3}"
+    return ("", "Dezena de ", "Centena de ")[ordem] + nome
+
+
+def digitos(n, base=10):
+    """
+      -> Separa os dígitos de um número inteiro
+    :param n: número inteiro (o sinal é ignorado)
+    :param base: base dos dígitos
+    :return: lista de dígitos, começando pela unidade
+    """
+    n = abs(n)
+    lista = [n % base]
+    n //= base
+    while n:
+        n, d = divmod(n, base)
+        lista.append(d)
+    return lista
+
+
+def casas(n, minimo=1):
+    """
+      -> Decompõe o número nas suas casas decimais, sem limite de tamanho
+    :param n: número inteiro
+    :param minimo: quantidade mínima de casas (as que faltarem saem com dígito 0)
+    :return: lista de tuplas (nome da casa, dígito), começando pela unidade
+    """
+    lista = digitos(n)
+    lista += [0] * (minimo - len(lista))
+    return [(nome_casa(p), d) for p, d in enumerate(lista)]
+
+
+def converter(n, base):
+    """
+      -> Escreve um número inteiro em qualquer base de 2 a 36
+    :param n: número inteiro
+    :param base: base de destino
+    :return: string com o número na nova base (sem prefixo como 0b ou 0x)
+    """
+    if not 2 <= base <= 36:
+        raise ValueError("A base precisa estar entre 2 e 36")
+    if base == 10:
+        return str(n)
+    if base in (2, 8, 16):
+        return format(n, {2: "b", 8: "o", 16: "x"}[base])
+    texto = "".join(ALFABETO[d] for d in reversed(digitos(n, base)))
+    return "-" + texto if n < 0 else texto
+
+
+def digitos_lote(nums, base=10, largura=None):
+    """
+      -> Separa os dígitos de muitos números de uma vez
+    :param nums: sequência ou array de inteiros não negativos
+    :param base: base dos dígitos
+    :param largura: quantidade de casas (o padrão é o suficiente para o maior número)
+    :return: matriz (um número por linha) com a casa mais alta na primeira coluna
+    """
+    if np is None:
+        nums = [int(n) for n in nums]
+        if largura is None:
+            largura = len(digitos(max(nums, default=0), base))
+        return [[n // base ** p % base for p in range(largura - 1, -1, -1)] for n in nums]
+    nums = np.asarray(nums, dtype=np.uint64)
+    if largura is None:
+        largura = len(digitos(int(nums.max(initial=0)), base))
+    pesos = np.uint64(base) ** np.arange(largura - 1, -1, -1, dtype=np.uint64)
+    return (nums[:, None] // pesos) % np.uint64(base)
+
+
+def converter_lote(nums, base):
+    """
+      -> Converte muitos números para a mesma base numa só passada
+    :param nums: sequência ou array de inteiros não negativos
+    :param base: base de destino (2 a 36)
+    :return: lista de strings
+    """
+    if not 2 <= base <= 36:
+        raise ValueError("A base precisa estar entre 2 e 36")
+    if np is None:
+        return [converter(int(n), base) for n in nums]
+    matriz = digitos_lote(nums, base)
+    if matriz.size == 0:
+        return ["0"] * len(matriz)
+    letras = np.frombuffer(ALFABETO.encode(), dtype=np.uint8)[matriz.astype(np.intp)]
+    textos = np.ascontiguousarray(letras).view(f"S{matriz.shape[1]}").ravel()
+    return [t.lstrip(b"0").decode() or "0" for t in textos]
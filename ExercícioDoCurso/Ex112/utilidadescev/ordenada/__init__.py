@@ -0,0 +1,137 @@
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import groupby
+
+
+class ListaOrdenada:
+    """
+      -> Lista que está sempre em ordem, guardada em blocos pequenos;
+         inserir, procurar e achar a posição custam O(log n) na busca
+         (mais o deslocamento dentro de um bloco de no máximo 2 * carga itens)
+    :param valores: valores iniciais
+    :param unica: se True, valores repetidos não são adicionados
+    :param carga: tamanho de referência dos blocos
+    """
+
+    def __init__(self, valores=(), unica=False, carga=1000):
+        self.unica = unica
+        self.carga = carga
+        self._listas = list()
+        self._maximos = list()
+        self._tamanho = 0
+        self._acumulado = None
+        self.juntar(valores)
+
+    def __len__(self):
+        return self._tamanho
+
+    def __iter__(self):
+        for lista in self._listas:
+            yield from lista
+
+    def __repr__(self):
+        return f"ListaOrdenada({list(self)})"
+
+    def __contains__(self, valor):
+        i = bisect_left(self._maximos, valor)
+        if i == len(self._maximos):
+            return False
+        lista = self._listas[i]
+        pos = bisect_left(lista, valor)
+        return lista[pos] == valor
+
+    def _indices(self):
+        if self._acumulado is None:
+            self._acumulado = [0]
+            for lista in self._listas:
+                self._acumulado.append(self._acumulado[-1] + len(lista))
+        return self._acumulado
+
+    def __getitem__(self, indice):
+        if indice < 0:
+            indice += self._tamanho
+        if not 0 <= indice < self._tamanho:
+            raise IndexError("Índice fora da lista")
+        acumulado = self._indices()
+        i = bisect_right(acumulado, indice) - 1
+        return self._listas[i][indice - acumulado[i]]
+
+    def adicionar(self, valor):
+        """
+        :return: True se o valor foi adicionado (False se a lista é única e ele já existia)
+        """
+        if not self._listas:
+            self._listas.append([valor])
+            self._maximos.append(valor)
+        else:
+            i = min(bisect_left(self._maximos, valor), len(self._maximos) - 1)
+            lista = self._listas[i]
+            pos = bisect_left(lista, valor)
+            if self.unica and pos < len(lista) and lista[pos] == valor:
+                return False
+            lista.insert(pos, valor)
+            self._maximos[i] = lista[-1]
+            if len(lista) > 2 * self.carga:
+                self._listas[i:i + 1] = [lista[:self.carga], lista[self.carga:]]
+                self._maximos[i:i + 1] = [lista[self.carga - 1], lista[-1]]
+        self._tamanho += 1
+        self._acumulado = None
+        return True
+
+    def remover(self, valor):
+        i = bisect_left(self._maximos, valor)
+        if i < len(self._maximos):
+            lista = self._listas[i]
+            pos = bisect_left(lista, valor)
+            if lista[pos] == valor:
+                del lista[pos]
+                if lista:
+                    self._maximos[i] = lista[-1]
+                else:
+                    del self._listas[i]
+                    del self._maximos[i]
+                self._tamanho -= 1
+                self._acumulado = None
+                return
+        raise ValueError(f"{valor} não está na lista")
+
+    def posicao(self, valor):
+        """
+          -> Quantos valores da lista são menores que valor
+        """
+        i = bisect_left(self._maximos, valor)
+        if i == len(self._maximos):
+            return self._tamanho
+        return self._indices()[i] + bisect_left(self._listas[i], valor)
+
+    def intervalo(self, minimo=None, maximo=None):
+        """
+          -> Percorre, em ordem, os valores entre minimo e maximo (inclusive)
+        """
+        i = 0 if minimo is None else bisect_left(self._maximos, minimo)
+        pos = 0 if minimo is None or i == len(self._listas) else bisect_left(self._listas[i], minimo)
+        for lista in self._listas[i:]:
+            for valor in lista[pos:]:
+                if maximo is not None and valor > maximo:
+                    return
+                yield valor
+            pos = 0
+
+    def juntar(self, valores):
+        """
+          -> Junta muitos valores de uma vez (ordena os novos e intercala com os atuais)
+        :return: quantidade de valores adicionados
+        """
+        novos = sorted(valores)
+        if not novos:
+            return 0
+        todos = merge(self, novos)
+        if self.unica:
+            todos = (v for v, _ in groupby(todos))
+        todos = list(todos)
+        antes = self._tamanho
+        self._listas = [todos[p:p + self.carga] for p in range(0, len(todos), self.carga)]
+        self._maximos = [lista[-1] for lista in self._listas]
+        self._tamanho = len(todos)
+        self._acumulado = None
+        return self._tamanho - antes
@@ -0,0 +1,84 @@
+import mmap
+import unicodedata
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def normalizar(c):
+    """
+      -> Tira acentos, pontuação e espaços e deixa tudo no mesmo caso
+    :param c: caractere a ser normalizado
+    :return: string só com as letras e números que importam na comparação
+    """
+    return "".join(x for x in unicodedata.normalize("NFKD", c).casefold() if x.isalnum())
+
+
+def palindromo(frase):
+    """
+      -> Verifica se uma frase é um palíndromo
+         ("Socorram-me, subi no ônibus em Marrocos" é)
+    :param frase: frase a ser analisada
+    :return: True se for palíndromo
+    """
+    limpa = "".join(map(normalizar, frase))
+    return limpa == limpa[::-1]
+
+
+def verificar_lote(frases):
+    """
+      -> Verifica várias frases curtas, uma de cada vez, sem montar listas
+    :param frases: iterável de frases (por exemplo, as linhas de um arquivo)
+    :return: gerador com True/False para cada frase
+    """
+    for frase in frases:
+        yield palindromo(frase.rstrip("\n"))
+
+
+def _frente(mm, fim):
+    i = 0
+    while i < fim:
+        b = mm[i]
+        if b < 0x80:
+            t = 1
+        elif b >= 0xF0:
+            t = 4
+        elif b >= 0xE0:
+            t = 3
+        else:
+            t = 2
+        for x in normalizar(mm[i:i + t].decode("utf-8", "replace")):
+            yield i, x
+        i += t
+
+
+def _tras(mm, fim):
+    i = fim
+    while i > 0:
+        j = i - 1
+        while j > 0 and mm[j] & 0xC0 == 0x80:
+            j -= 1
+        for x in reversed(normalizar(mm[j:i].decode("utf-8", "replace"))):
+            yield j, x
+        i = j
+
+
+def palindromo_arquivo(arq):
+    """
+      -> Verifica se o texto de um arquivo (UTF-8) é um palíndromo,
+         lendo das duas pontas do arquivo mapeado, sem copiar o texto
+    :param arq: caminho do arquivo
+    :return: True se for palíndromo
+    """
+    with open(arq, "rb") as a:
+        try:
+            mm = mmap.mmap(a.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return True
+        with mm:
+            fim = len(mm)
+            for (pf, cf), (pt, ct) in zip(_frente(mm, fim), _tras(mm, fim)):
+                if pf > pt:
+                    break
+                if cf != ct:
+                    return False
+    return True
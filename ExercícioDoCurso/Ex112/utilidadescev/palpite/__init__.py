@@ -0,0 +1,126 @@
+import random
+from collections import Counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+MENOS = -1
+ACERTOU = 0
+MAIS = 1
+
+
+class Pensador:
+    """
+      -> O lado que pensa no número e responde às dicas do 058
+         ("Um pouco Mais!", "Um pouco Menos!"); pode ser reaproveitado
+         para várias partidas com novo()
+    :param minimo: menor número possível
+    :param maximo: maior número possível
+    :param secreto: número pensado (o padrão é sortear um); também pode ser um array
+                    do NumPy com vários números, para responder a muitas partidas de uma vez
+    """
+
+    def __init__(self, minimo=0, maximo=10, secreto=None):
+        self.minimo = minimo
+        self.maximo = maximo
+        self.novo(secreto)
+
+    def novo(self, secreto=None):
+        if secreto is None:
+            secreto = random.randint(self.minimo, self.maximo)
+        elif np is not None and isinstance(secreto, np.ndarray):
+            if secreto.size and (secreto.min() < self.minimo or secreto.max() > self.maximo):
+                raise ValueError(f"Há números fora de {self.minimo} a {self.maximo}")
+        elif not self.minimo <= secreto <= self.maximo:
+            raise ValueError(f"O número {secreto} está fora de {self.minimo} a {self.maximo}")
+        self.secreto = secreto
+        self.palpites = 0
+
+    def responder(self, chute):
+        """
+        :return: MAIS se o número pensado for maior, MENOS se for menor, ACERTOU se for igual
+                 (com vários números pensados, chute e resposta são arrays)
+        """
+        self.palpites += 1
+        if np is not None and isinstance(self.secreto, np.ndarray):
+            return np.where(self.secreto > chute, MAIS,
+                            np.where(self.secreto < chute, MENOS, ACERTOU)).astype(np.int8)
+        if self.secreto > chute:
+            return MAIS
+        if self.secreto < chute:
+            return MENOS
+        return ACERTOU
+
+
+def resolver(pensador, minimo=None, maximo=None):
+    """
+      -> Descobre o número do pensador por bissecção
+    :param pensador: qualquer objeto com responder(chute) que devolva MAIS, MENOS ou ACERTOU
+    :param minimo: menor número possível (o padrão é o do pensador)
+    :param maximo: maior número possível (o padrão é o do pensador)
+    :return: tupla (número descoberto, quantidade de palpites)
+    """
+    baixo = pensador.minimo if minimo is None else minimo
+    alto = pensador.maximo if maximo is None else maximo
+    palpites = 0
+    while baixo <= alto:
+        meio = baixo + (alto - baixo) // 2
+        palpites += 1
+        resposta = pensador.responder(meio)
+        if resposta == ACERTOU:
+            return meio, palpites
+        if resposta == MAIS:
+            baixo = meio + 1
+        else:
+            alto = meio - 1
+    raise ValueError("As respostas do pensador não são consistentes")
+
+
+def _palpites_lote(segredos, minimo, maximo):
+    if np is None or minimo < 0 or maximo >= 2 ** 64:
+        pensador = Pensador(minimo, maximo, minimo)
+        contagem = list()
+        for s in segredos:
+            pensador.novo(s)
+            contagem.append(resolver(pensador)[1])
+        return contagem
+    # um único Pensador com todos os números; cada rodada manda um array de chutes
+    pensador = Pensador(minimo, maximo, np.asarray(segredos, dtype=np.uint64))
+    baixo = np.full(pensador.secreto.shape, minimo, dtype=np.uint64)
+    alto = np.full(pensador.secreto.shape, maximo, dtype=np.uint64)
+    contagem = np.zeros(pensador.secreto.shape, dtype=np.int64)
+    pendentes = np.ones(pensador.secreto.shape, dtype=bool)
+    while pendentes.any():
+        meio = baixo + (alto - baixo) // np.uint64(2)
+        resposta = pensador.responder(meio)
+        contagem += pendentes
+        pendentes &= resposta != ACERTOU
+        baixo = np.where(resposta == MAIS, meio + np.uint64(1), baixo)
+        alto = np.where(resposta == MENOS, meio - np.uint64(1), alto)
+    return contagem
+
+
+def resolver_lote(segredos, minimo=0, maximo=2 ** 63):
+    """
+      -> Resolve muitos números de uma vez e resume quantos palpites foram precisos;
+         as respostas vêm sempre do Pensador (com o NumPy, um só Pensador responde
+         a todas as partidas com arrays de chutes)
+    :param segredos: sequência ou array com os números pensados
+    :param minimo: menor número possível
+    :param maximo: maior número possível
+    :return: dicionário com a distribuição {palpites: quantidade}, a média e o máximo
+    """
+    contagem = _palpites_lote(segredos, minimo, maximo)
+    info = dict()
+    if np is not None and isinstance(contagem, np.ndarray):
+        freq = np.bincount(contagem)
+        info["distribuição"] = {int(p): int(q) for p, q in enumerate(freq) if q}
+    else:
+        info["distribuição"] = dict(sorted(Counter(contagem).items()))
+    total = sum(info["distribuição"].values())
+    info["total"] = total
+    info["média"] = sum(p * q for p, q in info["distribuição"].items()) / total if total else 0.0
+    info["máximo"] = max(info["distribuição"], default=0)
+    return info
@@ -0,0 +1,63 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def par(n):
+    return n % 2 == 0
+
+
+def particionar(valores, condicao=par, ordenar=False):
+    """
+      -> Separa os valores em dois grupos numa passada só
+    :param valores: qualquer iterável, ou array do NumPy (aí a condição é aplicada ao array inteiro)
+    :param condicao: função que diz para qual grupo vai cada valor (o padrão separa pares e ímpares)
+    :param ordenar: se True, ordena os valores uma vez só antes de separar,
+                    e os dois grupos já saem em ordem
+    :return: tupla (valores que atendem a condição, valores que não atendem)
+    """
+    if np is not None and isinstance(valores, np.ndarray):
+        if ordenar:
+            valores = np.sort(valores, kind="stable")
+        mascara = np.asarray(condicao(valores), dtype=bool)
+        return valores[mascara], valores[~mascara]
+    if ordenar:
+        valores = sorted(valores)
+    sim = list()
+    nao = list()
+    for v in valores:
+        (sim if condicao(v) else nao).append(v)
+    return sim, nao
+
+
+def particionar_no_lugar(valores, condicao=par, bloco=1 << 16):
+    """
+      -> Reorganiza a própria lista (ou array) com os valores que atendem a condição
+         na frente, sem mudar a ordem dentro de cada grupo; só o segundo grupo
+         é copiado para fora (no array, o primeiro é puxado para frente um bloco por vez)
+    :param valores: lista ou array do NumPy
+    :param condicao: função que diz para qual grupo vai cada valor
+    :param bloco: tamanho dos pedaços do array puxados para frente de cada vez
+    :return: posição onde começa o segundo grupo
+    """
+    if np is not None and isinstance(valores, np.ndarray):
+        mascara = np.asarray(condicao(valores), dtype=bool)
+        nao = valores[~mascara]
+        k = 0
+        for ini in range(0, valores.size, bloco):
+            sim = valores[ini:ini + bloco][mascara[ini:ini + bloco]]
+            valores[k:k + sim.size] = sim
+            k += sim.size
+        valores[k:] = nao
+        return k
+    nao = list()
+    k = 0
+    for v in valores:
+        if condicao(v):
+            valores[k] = v
+            k += 1
+        else:
+            nao.append(v)
+    valores[k:] = nao
+    return k
@@ -0,0 +1,148 @@
+import struct
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_CABECALHO = struct.Struct("<4sQQ")
+_MARCA = b"PES1"
+_IDADE_MAXIMA = 65535
+
+
+class Pessoas:
+    """
+      -> Cadastro de pessoas guardado em colunas: os nomes ficam todos juntos
+         num único bloco de bytes (com as posições de início de cada um),
+         as idades num array de inteiros e o sexo como um byte ("M" ou "F")
+    """
+
+    def __init__(self):
+        self._nomes = bytearray()
+        self._inicio = array("Q", [0])
+        self.idades = array("H")
+        self.sexos = bytearray()
+
+    def __len__(self):
+        return len(self.idades)
+
+    def adicionar(self, nome, idade, sexo):
+        sexo = sexo.strip().upper()[:1]
+        if sexo not in ("M", "F"):
+            raise ValueError(f"Sexo '{sexo}' inválido, use M ou F")
+        if not 0 <= idade <= _IDADE_MAXIMA:
+            raise ValueError(f"Idade {idade} inválida, use um valor entre 0 e {_IDADE_MAXIMA}")
+        self._nomes += nome.encode("utf-8")
+        self._inicio.append(len(self._nomes))
+        self.idades.append(idade)
+        self.sexos += sexo.encode()
+
+    def nome(self, i):
+        return self._nomes[self._inicio[i]:self._inicio[i + 1]].decode("utf-8")
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Pessoa não cadastrada")
+        return {"nome": self.nome(i), "sexo": chr(self.sexos[i]), "idade": self.idades[i]}
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def _mascara(self, sexo=None, a_partir_de=None, menor_que=None, acima_de=None):
+        if np is not None:
+            idades = np.frombuffer(self.idades, dtype=np.uint16)
+            mascara = np.ones(len(self), dtype=bool)
+            if sexo is not None:
+                mascara &= np.frombuffer(self.sexos, dtype=np.uint8) == ord(sexo)
+            if a_partir_de is not None:
+                mascara &= idades >= a_partir_de
+            if menor_que is not None:
+                mascara &= idades < menor_que
+            if acima_de is not None:
+                mascara &= idades > acima_de
+            return mascara
+        codigo = None if sexo is None else ord(sexo)
+        return [(codigo is None or s == codigo)
+                and (a_partir_de is None or i >= a_partir_de)
+                and (menor_que is None or i < menor_que)
+                and (acima_de is None or i > acima_de)
+                for i, s in zip(self.idades, self.sexos)]
+
+    def contar(self, sexo=None, a_partir_de=None, menor_que=None, acima_de=None):
+        """
+          -> Conta quantas pessoas atendem a todos os filtros informados
+        :param sexo: "M" ou "F"
+        :param a_partir_de: idade mínima (inclusive)
+        :param menor_que: idade máxima (exclusive)
+        :param acima_de: idade mínima (exclusive)
+        """
+        return int(sum(self._mascara(sexo, a_partir_de, menor_que, acima_de)))
+
+    def filtrar(self, sexo=None, a_partir_de=None, menor_que=None, acima_de=None):
+        """
+          -> Mesmos filtros do contar(), mas devolve as posições das pessoas
+        """
+        mascara = self._mascara(sexo, a_partir_de, menor_que, acima_de)
+        if np is not None:
+            return np.flatnonzero(mascara).tolist()
+        return [i for i, ok in enumerate(mascara) if ok]
+
+    def media_idade(self):
+        if len(self) == 0:
+            return 0.0
+        if np is not None:
+            return float(np.frombuffer(self.idades, dtype=np.uint16).mean())
+        return sum(self.idades) / len(self)
+
+    def contar_sexo(self):
+        return {"M": self.sexos.count(b"M"), "F": self.sexos.count(b"F")}
+
+    def acima_da_media(self):
+        return self.filtrar(acima_de=self.media_idade())
+
+    def mais_velho(self, sexo=None):
+        """
+        :return: posição da pessoa mais velha (do sexo informado), ou None
+        """
+        pos = self.filtrar(sexo)
+        if not pos:
+            return None
+        return max(pos, key=self.idades.__getitem__)
+
+    def salvar(self, arq):
+        """
+          -> Grava o cadastro num arquivo binário (tudo em little-endian)
+        """
+        inicio, idades = self._inicio, self.idades
+        if sys.byteorder == "big":
+            inicio, idades = array("Q", inicio), array("H", idades)
+            inicio.byteswap()
+            idades.byteswap()
+        with open(arq, "wb") as a:
+            a.write(_CABECALHO.pack(_MARCA, len(self), len(self._nomes)))
+            inicio.tofile(a)
+            idades.tofile(a)
+            a.write(self.sexos)
+            a.write(self._nomes)
+
+    @classmethod
+    def carregar(cls, arq):
+        p = cls()
+        with open(arq, "rb") as a:
+            marca, quant, tamanho = _CABECALHO.unpack(a.read(_CABECALHO.size))
+            if marca != _MARCA:
+                raise ValueError(f"O arquivo {arq} não é um cadastro de pessoas")
+            p._inicio = array("Q")
+            p._inicio.fromfile(a, quant + 1)
+            p.idades.fromfile(a, quant)
+            p.sexos = bytearray(a.read(quant))
+            p._nomes = bytearray(a.read(tamanho))
+        if sys.byteorder == "big":
+            p._inicio.byteswap()
+            p.idades.byteswap()
+        return p
@@ -0,0 +1,69 @@
+from array import array
+
+from .. import moeda
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def grade(precos, porcentagens):
+    """
+      -> Calcula todos os preços com todos os ajustes de uma vez
+         (mesmo cálculo do moeda.aumentar: preço / 100 * (100 + porcentagem))
+    :param precos: sequência ou array de preços
+    :param porcentagens: ajustes em %, positivos para aumento e negativos para desconto
+    :return: matriz com um preço por linha e um ajuste por coluna
+    """
+    if np is None:
+        fatores = [100 + p for p in porcentagens]
+        return [[preco / 100 * f for f in fatores] for preco in precos]
+    fatores = 100 + np.asarray(porcentagens, dtype=float)
+    return np.asarray(precos, dtype=float)[:, None] / 100 * fatores[None, :]
+
+
+def grade_blocos(precos, porcentagens, bloco=100_000):
+    """
+      -> Mesma grade, mas entregue aos poucos (um bloco de preços por vez)
+    :return: gerador de tuplas (preços do bloco, grade do bloco)
+    """
+    for ini in range(0, len(precos), bloco):
+        parte = precos[ini:ini + bloco]
+        yield parte, grade(parte, porcentagens)
+
+
+def rotulo(porcentagem):
+    if porcentagem < 0:
+        return f"{-porcentagem}% de desconto"
+    return f"{porcentagem}% de aumento"
+
+
+def escrever_tabela(saida, precos, porcentagens, bloco=100_000):
+    """
+      -> Escreve a grade como tabela formatada em reais
+    :param saida: arquivo (ou qualquer objeto com write) já aberto
+    """
+    largura = max([len(rotulo(p)) for p in porcentagens] + [12])
+    saida.write(f"{'Preço':>{largura}}" + "".join(f"{rotulo(p):>{largura + 1}}" for p in porcentagens) + "\n")
+    for parte, valores in grade_blocos(precos, porcentagens, bloco):
+        for preco, linha in zip(parte, valores):
+            saida.write(f"{moeda.moeda(preco):>{largura}}" + "".join(f"{moeda.moeda(v):>{largura + 1}}" for v in linha) + "\n")
+
+
+def escrever_csv(saida, precos, porcentagens, bloco=100_000, separador=";"):
+    saida.write(separador.join(["preço"] + [str(p) for p in porcentagens]) + "\n")
+    for parte, valores in grade_blocos(precos, porcentagens, bloco):
+        for preco, linha in zip(parte, valores):
+            saida.write(separador.join([f"{preco:.2f}"] + [f"{v:.2f}" for v in linha]) + "\n")
+
+
+def escrever_binario(saida, precos, porcentagens, bloco=100_000):
+    """
+      -> Escreve a grade como doubles em ordem de linha (arquivo aberto em modo "wb")
+    """
+    for parte, valores in grade_blocos(precos, porcentagens, bloco):
+        if np is None:
+            saida.write(array("d", (v for linha in valores for v in linha)))
+        else:
+            saida.write(valores.data)
@@ -0,0 +1,156 @@
+import random
+from math import sqrt
+from multiprocessing import Pool
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _sortear(rng, minimo, maximo, n):
+    if np is None:
+        return [rng.randint(minimo, maximo) for _ in range(n)]
+    return rng.integers(minimo, maximo + 1, n)
+
+
+def regra_jokenpo(jogada, pc):
+    """
+      -> 0 Pedra, 1 Papel, 2 Tesoura (045/045b)
+    """
+    return (jogada - pc + 1) % 3 - 1
+
+
+def regra_par_ou_impar(jogada, pc):
+    """
+      -> jogada = número * 2 + escolha (0 para par, 1 para ímpar) (068)
+    """
+    return 2 * ((jogada // 2 + pc) % 2 == jogada % 2) - 1
+
+
+def regra_adivinha(jogada, pc):
+    """
+      -> Ganha quem acertar o número pensado pelo computador (028)
+    """
+    return 2 * (jogada == pc) - 1
+
+
+class Jogo:
+    """
+      -> Um jogo contra o computador
+    :param nome: nome do jogo
+    :param minimo: menor valor que o computador sorteia
+    :param maximo: maior valor que o computador sorteia
+    :param regra: função(jogada, pc) que devolve 1 (vitória), 0 (empate) ou -1 (derrota);
+                  precisa funcionar tanto com números quanto com arrays
+    """
+
+    def __init__(self, nome, minimo, maximo, regra):
+        self.nome = nome
+        self.minimo = minimo
+        self.maximo = maximo
+        self.regra = regra
+
+    def jogar(self, rng, jogadas):
+        pc = _sortear(rng, self.minimo, self.maximo, len(jogadas))
+        if np is None:
+            return [self.regra(j, p) for j, p in zip(jogadas, pc)]
+        return self.regra(np.asarray(jogadas), pc)
+
+
+JOKENPO = Jogo("Jokenpô", 0, 2, regra_jokenpo)
+PAR_OU_IMPAR = Jogo("Par ou Ímpar", 0, 10, regra_par_ou_impar)
+ADIVINHA = Jogo("Adivinha", 0, 5, regra_adivinha)
+
+
+class Fixa:
+    """
+      -> Estratégia que joga sempre o mesmo valor
+    """
+
+    def __init__(self, valor):
+        self.valor = valor
+
+    def __call__(self, rng, n):
+        return [self.valor] * n if np is None else np.full(n, self.valor)
+
+
+class Aleatoria:
+    """
+      -> Estratégia que sorteia a jogada entre minimo e maximo
+    """
+
+    def __init__(self, minimo, maximo):
+        self.minimo = minimo
+        self.maximo = maximo
+
+    def __call__(self, rng, n):
+        return _sortear(rng, self.minimo, self.maximo, n)
+
+
+def _rodar(tarefa):
+    jogo, estrategia, rodadas, semente, bloco = tarefa
+    if np is None:
+        rng = random.Random(semente)
+    else:
+        rng = np.random.default_rng(semente)
+    placar = [0, 0, 0]
+    while rodadas > 0:
+        n = min(bloco, rodadas)
+        res = jogo.jogar(rng, estrategia(rng, n))
+        if np is None:
+            for r in res:
+                placar[r + 1] += 1
+        else:
+            cont = np.bincount(np.asarray(res) + 1, minlength=3)
+            for p in range(3):
+                placar[p] += int(cont[p])
+        rodadas -= n
+    return placar
+
+
+def intervalo(sucessos, total, z=1.96):
+    """
+      -> Intervalo de confiança de Wilson para uma proporção (95% por padrão)
+    """
+    if total == 0:
+        return 0.0, 1.0
+    p = sucessos / total
+    base = 1 + z ** 2 / total
+    centro = (p + z ** 2 / (2 * total)) / base
+    margem = z * sqrt(p * (1 - p) / total + z ** 2 / (4 * total ** 2)) / base
+    return centro - margem, centro + margem
+
+
+def simular(jogo, estrategia, rodadas, processos=1, semente=None, bloco=1_000_000):
+    """
+      -> Joga muitas rodadas sem interação e sem pausas
+    :param jogo: Jogo a ser simulado (JOKENPO, PAR_OU_IMPAR, ADIVINHA...)
+    :param estrategia: função(rng, n) que devolve as n jogadas do jogador
+    :param rodadas: quantidade total de rodadas
+    :param processos: quantidade de processos; cada um recebe sua própria semente
+    :param semente: semente para repetir a simulação
+    :param bloco: quantidade de rodadas sorteadas de uma vez
+    :return: dicionário com o placar, as taxas e o intervalo de confiança de cada taxa
+    """
+    if np is None:
+        gerador = random.Random(semente)
+        sementes = [gerador.getrandbits(64) for _ in range(processos)]
+    else:
+        sementes = np.random.SeedSequence(semente).spawn(processos)
+    partes = [rodadas // processos + (p < rodadas % processos) for p in range(processos)]
+    tarefas = [(jogo, estrategia, n, s, bloco) for n, s in zip(partes, sementes)]
+    if processos == 1:
+        placares = [_rodar(tarefas[0])]
+    else:
+        with Pool(processos) as pool:
+            placares = pool.map(_rodar, tarefas)
+    derrotas, empates, vitorias = (sum(p[i] for p in placares) for i in range(3))
+    info = dict()
+    info["jogo"] = jogo.nome
+    info["rodadas"] = rodadas
+    for nome, quant in (("vitórias", vitorias), ("empates", empates), ("derrotas", derrotas)):
+        info[nome] = quant
+        info[f"taxa de {nome}"] = quant / rodadas if rodadas else 0.0
+        info[f"intervalo de {nome}"] = intervalo(quant, rodadas)
+    return info
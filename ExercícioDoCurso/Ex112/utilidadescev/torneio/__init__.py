@@ -0,0 +1,127 @@
+import heapq
+import random
+from itertools import count
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class Placar:
+    """
+      -> Ranking que é atualizado aos poucos, conforme os resultados chegam;
+         cada atualização custa O(log n) e o top k custa O(k log n)
+    :param desempate: "chegada" (em caso de empate, fica na frente quem chegou
+                      primeiro naquela pontuação) ou "nome" (ordem alfabética)
+    """
+
+    def __init__(self, desempate="chegada"):
+        if desempate not in ("chegada", "nome"):
+            raise ValueError("desempate precisa ser 'chegada' ou 'nome'")
+        self.desempate = desempate
+        self.pontos = dict()
+        self._heap = list()
+        self._atual = dict()
+        self._contador = count()
+
+    def __len__(self):
+        return len(self.pontos)
+
+    def _entrada(self, nome, seq=None):
+        if seq is None:
+            seq = next(self._contador)
+        self._atual[nome] = seq
+        chave = seq if self.desempate == "chegada" else nome
+        return -self.pontos[nome], chave, seq, nome
+
+    def registrar(self, nome, pontos):
+        """
+          -> Soma pontos a um jogador (cria o jogador se ele ainda não existir)
+        """
+        self.pontos[nome] = self.pontos.get(nome, 0) + pontos
+        heapq.heappush(self._heap, self._entrada(nome))
+        if len(self._heap) > 2 * len(self.pontos) + 64:
+            self._refazer()
+
+    def registrar_lote(self, nomes, pontos):
+        for nome, p in zip(nomes, pontos):
+            self.registrar(nome, p)
+
+    def carregar(self, pontos):
+        """
+          -> Troca todo o placar de uma vez (heapify em O(n))
+        :param pontos: dicionário {nome: pontos} (ou pares nome, pontos)
+        """
+        self.pontos = dict(pontos)
+        self._refazer()
+
+    def _refazer(self):
+        # cada jogador mantém a sequência da última chegada, para o desempate não mudar
+        anteriores = self._atual
+        self._atual = dict()
+        self._heap = [self._entrada(nome, anteriores.get(nome)) for nome in self.pontos]
+        heapq.heapify(self._heap)
+
+    def top(self, k=10):
+        """
+        :return: lista de tuplas (nome, pontos) dos k primeiros colocados
+        """
+        validos = list()
+        while self._heap and len(validos) < k:
+            entrada = heapq.heappop(self._heap)
+            if self._atual.get(entrada[3]) == entrada[2]:
+                validos.append(entrada)
+        for entrada in validos:
+            heapq.heappush(self._heap, entrada)
+        return [(nome, -negativo) for negativo, chave, seq, nome in validos]
+
+
+def rodadas(jogadores, quant, faces=6, semente=None, bloco=1000):
+    """
+      -> Sorteia os dados de todos os jogadores, rodada por rodada
+    :param jogadores: quantidade de jogadores
+    :param quant: quantidade de rodadas
+    :param faces: faces do dado
+    :param semente: semente para repetir o torneio
+    :param bloco: rodadas sorteadas de uma vez
+    :return: gerador com um array (ou lista) de resultados por rodada
+    """
+    for dados in _blocos(jogadores, quant, faces, semente, bloco):
+        yield from dados
+
+
+def _blocos(jogadores, quant, faces, semente, bloco):
+    if np is None:
+        rng = random.Random(semente)
+        for _ in range(quant):
+            yield [[rng.randint(1, faces) for _ in range(jogadores)]]
+        return
+    rng = np.random.default_rng(semente)
+    for ini in range(0, quant, bloco):
+        yield rng.integers(1, faces + 1, (min(bloco, quant - ini), jogadores), dtype=np.int16)
+
+
+def torneio(nomes, quant, faces=6, semente=None, desempate="chegada"):
+    """
+      -> Joga um torneio de dados: cada jogador soma o valor de todas as suas jogadas
+    :param nomes: nomes dos jogadores
+    :param quant: quantidade de rodadas
+    :param faces: faces do dado
+    :param semente: semente para repetir o torneio
+    :param desempate: regra de desempate do Placar
+    :return: Placar com o total de cada jogador
+    """
+    nomes = list(nomes)
+    if np is None:
+        totais = [0] * len(nomes)
+        for rodada in rodadas(len(nomes), quant, faces, semente):
+            totais = [t + d for t, d in zip(totais, rodada)]
+    else:
+        totais = np.zeros(len(nomes), dtype=np.int64)
+        for dados in _blocos(len(nomes), quant, faces, semente, 1000):
+            totais += dados.sum(axis=0)
+        totais = totais.tolist()
+    placar = Placar(desempate)
+    placar.carregar(zip(nomes, totais))
+    return placar
@@ -0,0 +1,120 @@
+from collections import deque
+from fractions import Fraction
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_dimensao = dict()
+_ligacoes = dict()
+_para_base = dict()
+
+
+def _exato(x):
+    return Fraction(repr(x)) if isinstance(x, float) else Fraction(x)
+
+
+def registrar(unidade, referencia, escala, deslocamento=0.0, dimensao=None):
+    """
+      -> Registra uma unidade a partir de outra: valor_em_referencia = valor * escala + deslocamento
+    :param unidade: nome da nova unidade (ex: "km")
+    :param referencia: unidade já registrada (ex: "m"); se for None, a unidade é a base da dimensão
+    :param escala: quantas referências cabem em uma unidade (int, float ou Fraction;
+                   os fatores são combinados como frações, sem erro de arredondamento)
+    :param deslocamento: usado em conversões como as de temperatura
+    :param dimensao: nome da dimensão (só é preciso para a unidade base)
+    """
+    if unidade in _dimensao:
+        raise ValueError(f"A unidade {unidade} já está registrada")
+    if referencia is None:
+        if dimensao is None:
+            raise ValueError("A unidade base precisa de uma dimensão")
+        _dimensao[unidade] = dimensao
+        _ligacoes[unidade] = list()
+    else:
+        if referencia not in _dimensao:
+            raise ValueError(f"A unidade {referencia} não está registrada")
+        if escala == 0:
+            raise ValueError("A escala não pode ser zero")
+        escala, deslocamento = _exato(escala), _exato(deslocamento)
+        _dimensao[unidade] = _dimensao[referencia]
+        _ligacoes[unidade] = [(referencia, 1 / escala, -deslocamento / escala)]
+        _ligacoes[referencia].append((unidade, escala, deslocamento))
+    _para_base.clear()
+    conversor.cache_clear()
+
+
+def _compilar():
+    for raiz in _dimensao:
+        if raiz in _para_base:
+            continue
+        _para_base[raiz] = (Fraction(1), Fraction(0))
+        fila = deque([raiz])
+        while fila:
+            atual = fila.popleft()
+            a, b = _para_base[atual]
+            for vizinho, escala, deslocamento in _ligacoes[atual]:
+                if vizinho not in _para_base:
+                    _para_base[vizinho] = (a / escala, (b - deslocamento) / escala)
+                    fila.append(vizinho)
+
+
+def fator(de, para):
+    """
+    :return: tupla (a, b) tal que valor_em_para = valor_em_de * a + b
+    """
+    for u in (de, para):
+        if u not in _dimensao:
+            raise ValueError(f"A unidade {u} não está registrada")
+    if _dimensao[de] != _dimensao[para]:
+        raise ValueError(f"Não dá para converter {_dimensao[de]} ({de}) em {_dimensao[para]} ({para})")
+    if not _para_base:
+        _compilar()
+    a_de, b_de = _para_base[de]
+    a_para, b_para = _para_base[para]
+    return float(a_para / a_de), float(b_para - b_de * a_para / a_de)
+
+
+@lru_cache(maxsize=256)
+def conversor(de, para):
+    """
+      -> Função pronta que converte de uma unidade para outra (funciona com números e arrays)
+    """
+    a, b = fator(de, para)
+    if b == 0:
+        return lambda valor: valor * a
+    return lambda valor: valor * a + b
+
+
+def converter(valores, de, para):
+    """
+      -> Converte um valor ou muitos de uma vez
+    :param valores: número, sequência ou array
+    :param de: unidade de origem
+    :param para: unidade de destino
+    :return: número convertido, ou array (lista, sem o NumPy) com os valores convertidos
+    """
+    f = conversor(de, para)
+    if isinstance(valores, (int, float)):
+        return f(valores)
+    if np is None:
+        return [f(v) for v in valores]
+    return f(np.asarray(valores, dtype=float))
+
+
+def unidades(dimensao):
+    return [u for u, d in _dimensao.items() if d == dimensao]
+
+
+registrar("m", None, 1, dimensao="comprimento")
+registrar("km", "m", 1000)
+registrar("hm", "m", 100)
+registrar("dam", "m", 10)
+registrar("dm", "m", 0.1)
+registrar("cm", "m", 0.01)
+registrar("mm", "m", 0.001)
+registrar("°C", None, 1, dimensao="temperatura")
+registrar("°F", "°C", Fraction(5, 9), Fraction(-160, 9))
+registrar("K", "°C", 1, -273.15)
@@ -0,0 +1,137 @@
+import csv
+import random
+from itertools import repeat
+from time import perf_counter
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ALUGUEL = {"diaria": 60.0, "km": 0.15, "litro": 1.0}
+VIAGEM = {"gasolina": 4.95, "pedagio": 5.5, "taxa": 10.0,
+          "longa": 200.0, "pedagio_longa": 11.0, "taxa_longa": -10.0}
+
+
+def _colunas(*colunas):
+    """
+    :return: tupla (colunas, lote); no lote, os números soltos valem para todas as viagens
+    """
+    if all(isinstance(c, (int, float)) for c in colunas):
+        return colunas, False
+    if np is None:
+        return tuple(repeat(c) if isinstance(c, (int, float)) else c for c in colunas), True
+    return tuple(np.asarray(c, dtype=float) for c in colunas), True
+
+
+def aluguel(dias, km, litros=0, tarifa=ALUGUEL):
+    """
+      -> Valor do aluguel do carro: diárias + km rodados - gasolina que sobrou no tanque
+    :param dias: dias com o carro (número, sequência ou array)
+    :param km: quilômetros rodados
+    :param litros: litros já pagos que sobraram no tanque
+    :param tarifa: dicionário com "diaria", "km" e "litro"
+    """
+    (dias, km, litros), lote = _colunas(dias, km, litros)
+    if np is None and lote:
+        return [aluguel(d, k, l, tarifa) for d, k, l in zip(dias, km, litros)]
+    return dias * tarifa["diaria"] + km * tarifa["km"] - litros * tarifa["litro"]
+
+
+def viagem(distancia, consumo, pedagios=0, tarifa=VIAGEM):
+    """
+      -> Custo da viagem: combustível + pedágios + taxa; a partir de tarifa["longa"] km
+         valem o pedágio e a taxa de viagem longa
+    :param distancia: km a percorrer (número, sequência ou array)
+    :param consumo: km por litro do carro
+    :param pedagios: quantidade de pedágios
+    :param tarifa: dicionário com os preços (veja VIAGEM)
+    """
+    (distancia, consumo, pedagios), lote = _colunas(distancia, consumo, pedagios)
+    if np is None and lote:
+        return [viagem(d, c, p, tarifa) for d, c, p in zip(distancia, consumo, pedagios)]
+    combustivel = distancia / consumo * tarifa["gasolina"]
+    if not lote:
+        if distancia >= tarifa["longa"]:
+            return combustivel + pedagios * tarifa["pedagio_longa"] + tarifa["taxa_longa"]
+        return combustivel + pedagios * tarifa["pedagio"] + tarifa["taxa"]
+    longa = distancia >= tarifa["longa"]
+    return (combustivel
+            + pedagios * np.where(longa, tarifa["pedagio_longa"], tarifa["pedagio"])
+            + np.where(longa, tarifa["taxa_longa"], tarifa["taxa"]))
+
+
+def ler_csv(arq, bloco=100_000, separador=";"):
+    """
+      -> Lê um CSV de viagens aos poucos; a primeira linha tem os nomes das colunas
+    :return: gerador de dicionários {coluna: valores do bloco}
+    """
+    with open(arq, "rt", encoding="utf-8", newline="") as a:
+        leitor = csv.reader(a, delimiter=separador)
+        nomes = [n.strip() for n in next(leitor, [])]
+        if not nomes or not all(n.isidentifier() for n in nomes):
+            raise ValueError(f"A primeira linha de {arq} precisa ter os nomes das colunas: {separador.join(nomes)!r}")
+        linhas = list()
+        for numero, linha in enumerate(leitor, 2):
+            if linha:
+                try:
+                    if len(linha) != len(nomes):
+                        raise ValueError
+                    linhas.append([float(v.replace(",", ".")) for v in linha])
+                except ValueError:
+                    raise ValueError(f"Linha {numero} inválida: {separador.join(linha)!r}") from None
+            if len(linhas) == bloco:
+                yield _bloco(nomes, linhas)
+                linhas = list()
+        if linhas:
+            yield _bloco(nomes, linhas)
+
+
+def _bloco(nomes, linhas):
+    if np is None:
+        return {n: list(col) for n, col in zip(nomes, zip(*linhas))}
+    tabela = np.array(linhas, dtype=float)
+    return {n: tabela[:, i] for i, n in enumerate(nomes)}
+
+
+def custear_csv(arq, calculo=viagem, tarifa=None, bloco=100_000, separador=";"):
+    """
+      -> Calcula o custo de cada viagem de um CSV, um bloco por vez
+    :param calculo: aluguel ou viagem; as colunas do CSV têm os nomes dos parâmetros
+                    (dias;km;litros ou distancia;consumo;pedagios)
+    :param tarifa: tabela de preços (se None, usa a padrão do cálculo)
+    :return: gerador com os custos de cada bloco
+    """
+    extra = dict() if tarifa is None else {"tarifa": tarifa}
+    for colunas in ler_csv(arq, bloco, separador):
+        yield calculo(**colunas, **extra)
+
+
+def benchmark(quant=10_000_000, bloco=1_000_000, semente=None):
+    """
+      -> Mede quanto tempo leva para custear muitas viagens e aluguéis aleatórios
+    :return: dicionário {cálculo: (segundos, viagens por segundo)}
+    """
+    tempos = {"aluguel": 0.0, "viagem": 0.0}
+    rng = np.random.default_rng(semente) if np is not None else random.Random(semente)
+    for ini in range(0, quant, bloco):
+        n = min(bloco, quant - ini)
+        if np is None:
+            dias = [rng.randint(1, 30) for _ in range(n)]
+            km = [rng.uniform(0, 3000) for _ in range(n)]
+            litros = [rng.uniform(0, 50) for _ in range(n)]
+            consumo = [rng.uniform(6, 18) for _ in range(n)]
+            pedagios = [rng.randint(0, 10) for _ in range(n)]
+        else:
+            dias = rng.integers(1, 31, n)
+            km = rng.uniform(0, 3000, n)
+            litros = rng.uniform(0, 50, n)
+            consumo = rng.uniform(6, 18, n)
+            pedagios = rng.integers(0, 11, n)
+        inicio = perf_counter()
+        aluguel(dias, km, litros)
+        tempos["aluguel"] += perf_counter() - inicio
+        inicio = perf_counter()
+        viagem(km, consumo, pedagios)
+        tempos["viagem"] += perf_counter() - inicio
+    return {c: (t, quant / t if t else float("inf")) for c, t in tempos.items()}